@@ -3,35 +3,110 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import os
+import shutil
+import sys
+import tarfile
 import tomllib
 import zipfile
+import zlib
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO
+
+try:
+    import deflate
+except ImportError:  # Optional `build` extra; only needed for D2RSO_ZIP_BACKEND.
+    deflate = None
+
+try:
+    import zstandard
+except ImportError:  # Optional `build` extra; only needed for D2RSO_EMIT_ZSTD.
+    zstandard = None
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 DIST_DIR = ROOT_DIR / "dist" / "d2rso"
 RELEASE_DIR = ROOT_DIR / "release"
 PYPROJECT_PATH = ROOT_DIR / "pyproject.toml"
 _ZIP_EPOCH_FLOOR = 315532800  # 1980-01-01T00:00:00Z
+_ZIP_CREATE_SYSTEM_UNIX = 3
+_ZIP_EXTERNAL_ATTR = 0o100644 << 16  # regular file, rw-r--r--
+DEFAULT_ZIP_LEVEL = 6
+MAX_ZIP_LEVEL = 9
+# libdeflate accepts levels 10-12 for a higher ratio at extra CPU cost.
+MAX_LIBDEFLATE_ZIP_LEVEL = 12
+_ZIP_LEVEL_ENV_VAR = "D2RSO_ZIP_LEVEL"
+# The two backends emit different DEFLATE streams, so the archive bytes depend
+# on this choice; it is opt-in and never inferred from what happens to be
+# installed.
+_ZIP_BACKEND_ENV_VAR = "D2RSO_ZIP_BACKEND"
+ZIP_BACKEND_ZLIB = "zlib"
+ZIP_BACKEND_LIBDEFLATE = "libdeflate"
+_COPY_CHUNK_SIZE = 1 << 20
+_EMIT_ZSTD_ENV_VAR = "D2RSO_EMIT_ZSTD"
+_ZSTD_LEVEL = 19
+# Payloads that are already compressed gain nothing from DEFLATE; store them as-is.
+_STORED_SUFFIXES = frozenset(
+    {
+        ".7z",
+        ".bz2",
+        ".gif",
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".png",
+        ".pyz",
+        ".webp",
+        ".xz",
+        ".zip",
+        ".zst",
+    }
+)
+_CASE_INSENSITIVE_PATHS = os.name == "nt"
+# Private ZipFile state that _append_member drives directly; when a Python
+# release drops any of it, members go through the public writestr() instead.
+_ZIPFILE_RAW_APPEND_ATTRIBUTES = (
+    "_writecheck",
+    "_didModify",
+    "fp",
+    "start_dir",
+    "filelist",
+    "NameToInfo",
+)
+# Linux sendfile() accepts a regular file as the destination; macOS does not.
+_USE_SENDFILE = sys.platform == "linux"
 
 
+@functools.lru_cache(maxsize=1)
 def _load_version() -> str:
-    with PYPROJECT_PATH.open("rb") as handle:
-        payload = tomllib.load(handle)
+    payload = tomllib.loads(PYPROJECT_PATH.read_text(encoding="utf-8"))
     return str(payload["project"]["version"])
 
 
-def _normalized_zip_timestamp() -> tuple[int, int, int, int, int, int]:
+def _env_var_enabled(name: str) -> bool:
+    raw_value = os.environ.get(name)
+    if raw_value is None:
+        return False
+    return raw_value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _normalized_epoch() -> int:
     raw_epoch = os.environ.get("SOURCE_DATE_EPOCH")
     try:
         epoch = int(raw_epoch) if raw_epoch is not None else _ZIP_EPOCH_FLOOR
     except ValueError:
         epoch = _ZIP_EPOCH_FLOOR
 
-    normalized_epoch = max(epoch, _ZIP_EPOCH_FLOOR)
-    timestamp = datetime.fromtimestamp(normalized_epoch, tz=timezone.utc)
+    return max(epoch, _ZIP_EPOCH_FLOOR)
+
+
+def _normalized_zip_timestamp() -> tuple[int, int, int, int, int, int]:
+    timestamp = datetime.fromtimestamp(_normalized_epoch(), tz=timezone.utc)
     return (
         timestamp.year,
         timestamp.month,
@@ -42,27 +117,302 @@ def _normalized_zip_timestamp() -> tuple[int, int, int, int, int, int]:
     )
 
 
-def _iter_bundle_files() -> list[Path]:
-    return sorted(path for path in DIST_DIR.rglob("*") if path.is_file())
+def _get_zip_backend() -> str:
+    raw_value = os.environ.get(_ZIP_BACKEND_ENV_VAR)
+    if raw_value is None or not raw_value.strip():
+        return ZIP_BACKEND_ZLIB
+
+    backend = raw_value.strip().lower()
+    if backend not in {ZIP_BACKEND_ZLIB, ZIP_BACKEND_LIBDEFLATE}:
+        raise SystemExit(
+            f"{_ZIP_BACKEND_ENV_VAR} must be {ZIP_BACKEND_ZLIB!r} or "
+            f"{ZIP_BACKEND_LIBDEFLATE!r}, got {raw_value!r}."
+        )
+    if backend == ZIP_BACKEND_LIBDEFLATE and deflate is None:
+        raise SystemExit(
+            f"{_ZIP_BACKEND_ENV_VAR}={ZIP_BACKEND_LIBDEFLATE} requires the deflate "
+            'package (pip install -e ".[build]").'
+        )
+    return backend
+
+
+def _get_compress_level(backend: str) -> int:
+    raw_value = os.environ.get(_ZIP_LEVEL_ENV_VAR)
+    if raw_value is None:
+        return DEFAULT_ZIP_LEVEL
+
+    try:
+        level = int(raw_value)
+    except ValueError:
+        return DEFAULT_ZIP_LEVEL
+
+    max_level = (
+        MAX_LIBDEFLATE_ZIP_LEVEL if backend == ZIP_BACKEND_LIBDEFLATE else MAX_ZIP_LEVEL
+    )
+    if not 0 <= level <= max_level:
+        return DEFAULT_ZIP_LEVEL
+
+    return level
+
+
+def _scan_bundle_dir(directory: str, prefix: str) -> Iterator[tuple[str, str]]:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            relative_path = f"{prefix}{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_bundle_dir(entry.path, f"{relative_path}/")
+            elif entry.is_file():
+                yield relative_path, entry.path
+
+
+def _bundle_sort_key(item: tuple[str, str]) -> list[str]:
+    relative_path = item[0]
+    if _CASE_INSENSITIVE_PATHS:
+        # WindowsPath compares lower-cased parts.
+        relative_path = relative_path.lower()
+    return relative_path.split("/")
+
+
+def _iter_bundle_files() -> list[tuple[str, str]]:
+    """Return ``(relative_posix_path, filesystem_path)`` pairs in archive order."""
+    # DirEntry carries the file type from the directory read, so this walk
+    # avoids a stat per entry. Sorting by path parts matches Path ordering,
+    # which is case-insensitive on Windows where releases are built.
+    return sorted(
+        _scan_bundle_dir(os.fspath(DIST_DIR), ""),
+        key=_bundle_sort_key,
+    )
+
+
+def _compress_member(
+    path: str, compress_level: int | None, backend: str
+) -> tuple[int, int, bytes | None]:
+    """
+    Return ``(crc32, file_size, raw_deflate_payload)`` for one bundle file.
 
+    ``compress_level=None`` marks a stored member: only the CRC and size are
+    computed, and the payload is ``None`` because the file is copied verbatim.
+    """
+    if compress_level is not None and backend == ZIP_BACKEND_LIBDEFLATE:
+        # libdeflate is one-shot only, so the member is read whole here: each
+        # worker holds the raw file plus its compressed copy in memory.
+        with open(path, "rb", buffering=0) as source:
+            data = source.readall()
+        return (
+            deflate.crc32(data),
+            len(data),
+            deflate.deflate_compress(data, compress_level),
+        )
 
-def _write_deterministic_zip(output_path: Path) -> None:
+    compressor = (
+        zlib.compressobj(compress_level, zlib.DEFLATED, -15)
+        if compress_level is not None
+        else None
+    )
+    crc = 0
+    file_size = 0
+    chunks: list[bytes] = []
+    with open(path, "rb", buffering=0) as source:
+        while chunk := source.read(_COPY_CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            if compressor is not None:
+                chunks.append(compressor.compress(chunk))
+    if compressor is None:
+        return crc, file_size, None
+    chunks.append(compressor.flush())
+    return crc, file_size, b"".join(chunks)
+
+
+def _copy_file_into(destination: BinaryIO, path: str, size: int) -> None:
+    with open(path, "rb", buffering=0) as source:
+        if not _USE_SENDFILE:
+            shutil.copyfileobj(source, destination, _COPY_CHUNK_SIZE)
+            return
+
+        # Kernel-side copy; the buffered writer is flushed first and re-seeked
+        # afterwards so its cached position matches the file descriptor again.
+        start = destination.tell()
+        destination.flush()
+        destination_fd = destination.fileno()
+        source_fd = source.fileno()
+        copied = 0
+        while copied < size:
+            sent = os.sendfile(destination_fd, source_fd, copied, size - copied)
+            if sent == 0:
+                raise OSError(
+                    f"{path} ended after {copied} of {size} bytes while being "
+                    "archived"
+                )
+            copied += sent
+        destination.seek(start + copied)
+
+
+def _append_member(
+    archive: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    path: str,
+    member: tuple[int, int, bytes | None],
+) -> None:
+    """
+    Write a precompressed or stored member to a seekable archive.
+
+    Mirrors what ``ZipFile.open(info, "w")`` does on close, so the central
+    directory written by ``ZipFile.close()`` picks the member up as usual.
+    """
+    crc, file_size, payload = member
+    info.flag_bits = 0
+    info.CRC = crc
+    info.file_size = file_size
+    info.compress_size = file_size if payload is None else len(payload)
+    zip64 = file_size * 1.05 > zipfile.ZIP64_LIMIT
+
+    archive._writecheck(info)
+    archive._didModify = True
+    archive.fp.seek(archive.start_dir)
+    info.header_offset = archive.fp.tell()
+    archive.fp.write(info.FileHeader(zip64))
+    if payload is None:
+        _copy_file_into(archive.fp, path, file_size)
+    else:
+        archive.fp.write(payload)
+    archive.start_dir = archive.fp.tell()
+    archive.filelist.append(info)
+    archive.NameToInfo[info.filename] = info
+
+
+def _supports_raw_member_append(archive: zipfile.ZipFile) -> bool:
+    """Return True when the ZipFile internals used by _append_member exist."""
+    return all(
+        hasattr(archive, name) for name in _ZIPFILE_RAW_APPEND_ATTRIBUTES
+    ) and hasattr(zipfile.ZipInfo, "FileHeader")
+
+
+def _write_member_with_stdlib(
+    archive: zipfile.ZipFile, info: zipfile.ZipInfo, path: str, compress_level: int
+) -> None:
+    """Write one member through the public ``writestr`` API, compressing it here."""
+    with open(path, "rb", buffering=0) as source:
+        data = source.readall()
+    if info.compress_type == zipfile.ZIP_STORED:
+        archive.writestr(info, data)
+    else:
+        # zlib tops out at level 9; libdeflate-only levels are clamped.
+        archive.writestr(info, data, compresslevel=min(compress_level, MAX_ZIP_LEVEL))
+
+
+def _new_zip_info(
+    name: str, timestamp: tuple[int, int, int, int, int, int], *, stored: bool
+) -> zipfile.ZipInfo:
+    # A fresh ZipInfo is cheaper than copy.copy() of a template: ZipInfo uses
+    # __slots__, so copying goes through the generic reduce path.
+    info = zipfile.ZipInfo(name, timestamp)
+    info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+    info.create_system = _ZIP_CREATE_SYSTEM_UNIX
+    info.external_attr = _ZIP_EXTERNAL_ATTR
+    return info
+
+
+def _is_stored(relative_path: str) -> bool:
+    return os.path.splitext(relative_path)[1].lower() in _STORED_SUFFIXES
+
+
+def _iter_compressed_members(
+    executor: ProcessPoolExecutor,
+    bundle_files: list[tuple[str, str]],
+    compress_level: int,
+    backend: str,
+    window: int,
+) -> Iterator[tuple[int, int, bytes | None]]:
+    """
+    Compress members in parallel and yield them back in archive order.
+
+    Unlike ``executor.map()``, which submits every member up front and lets
+    finished payloads pile up, only a bounded window of futures is in flight,
+    so peak memory stays at a few compressed members rather than the bundle.
+    """
+    pending: deque[Future[tuple[int, int, bytes | None]]] = deque()
+    for relative_path, path in bundle_files:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(
+            executor.submit(
+                _compress_member,
+                path,
+                None if _is_stored(relative_path) else compress_level,
+                backend,
+            )
+        )
+    while pending:
+        yield pending.popleft().result()
+
+
+def _write_deterministic_zip(
+    output_path: Path,
+    bundle_files: list[tuple[str, str]],
+    backend: str,
+    compress_level: int,
+) -> None:
     timestamp = _normalized_zip_timestamp()
+    workers = os.cpu_count() or 1
+    archive_prefix = f"{DIST_DIR.name}/"
+
     with zipfile.ZipFile(output_path, "w") as archive:
-        for path in _iter_bundle_files():
-            relative_path = path.relative_to(DIST_DIR).as_posix()
-            archive_name = f"{DIST_DIR.name}/{relative_path}"
+        if not _supports_raw_member_append(archive):
+            # Serial and zlib-only: slower, and a libdeflate build changes bytes,
+            # but the archive stays valid on a Python without these internals.
+            for relative_path, path in bundle_files:
+                info = _new_zip_info(
+                    archive_prefix + relative_path,
+                    timestamp,
+                    stored=_is_stored(relative_path),
+                )
+                _write_member_with_stdlib(archive, info, path, compress_level)
+            return
 
-            info = zipfile.ZipInfo(filename=archive_name, date_time=timestamp)
-            info.compress_type = zipfile.ZIP_DEFLATED
-            info.create_system = 3
-            info.external_attr = 0o100644 << 16
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            members = _iter_compressed_members(
+                executor, bundle_files, compress_level, backend, 2 * workers
+            )
+            for (relative_path, path), member in zip(
+                bundle_files, members, strict=True
+            ):
+                info = _new_zip_info(
+                    archive_prefix + relative_path, timestamp, stored=member[2] is None
+                )
+                _append_member(archive, info, path, member)
 
-            archive.writestr(info, path.read_bytes(), compresslevel=9)
+
+def _write_deterministic_tar_zst(
+    output_path: Path, bundle_files: list[tuple[str, str]]
+) -> None:
+    if zstandard is None:
+        raise SystemExit(
+            f"{_EMIT_ZSTD_ENV_VAR} requires the zstandard package "
+            '(pip install -e ".[build]").'
+        )
+
+    epoch = _normalized_epoch()
+    # threads=-1 uses zstd's multithreaded encoder, whose output does not depend
+    # on the worker count.
+    compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1)
+    with (
+        output_path.open("wb") as handle,
+        compressor.stream_writer(handle, closefd=False) as writer,
+        tarfile.open(fileobj=writer, mode="w|", format=tarfile.PAX_FORMAT) as archive,
+    ):
+        for relative_path, path in bundle_files:
+            info = tarfile.TarInfo(f"{DIST_DIR.name}/{relative_path}")
+            info.size = os.path.getsize(path)
+            info.mtime = epoch
+            info.mode = 0o644
+            with open(path, "rb") as source:
+                archive.addfile(info, source)
 
 
 def _write_sha256(output_path: Path) -> Path:
-    digest = hashlib.sha256(output_path.read_bytes()).hexdigest()
+    with output_path.open("rb", buffering=0) as handle:
+        digest = hashlib.file_digest(handle, "sha256").hexdigest()
     checksum_path = output_path.with_suffix(output_path.suffix + ".sha256")
     checksum_path.write_text(f"{digest}  {output_path.name}\n", encoding="utf-8")
     return checksum_path
@@ -74,13 +424,23 @@ def main() -> int:
 
     RELEASE_DIR.mkdir(parents=True, exist_ok=True)
     version = _load_version()
-    archive_path = RELEASE_DIR / f"d2rso-{version}-windows-x64.zip"
+    archive_stem = f"d2rso-{version}-windows-x64"
+    bundle_files = _iter_bundle_files()
+
+    zip_backend = _get_zip_backend()
+    zip_level = _get_compress_level(zip_backend)
+    print(f"ZIP backend: {zip_backend} (level {zip_level})")
 
-    _write_deterministic_zip(archive_path)
-    checksum_path = _write_sha256(archive_path)
+    archive_paths = [RELEASE_DIR / f"{archive_stem}.zip"]
+    _write_deterministic_zip(archive_paths[0], bundle_files, zip_backend, zip_level)
+    if _env_var_enabled(_EMIT_ZSTD_ENV_VAR):
+        archive_paths.append(RELEASE_DIR / f"{archive_stem}.tar.zst")
+        _write_deterministic_tar_zst(archive_paths[1], bundle_files)
 
-    print(archive_path)
-    print(checksum_path)
+    for archive_path in archive_paths:
+        checksum_path = _write_sha256(archive_path)
+        print(archive_path)
+        print(checksum_path)
     return 0
 
 
@@ -6,6 +6,8 @@ import argparse
 import time
 from typing import Any
 
+_EVENT_WAIT_TIMEOUT_MS = 100
+
 
 def _event_value(event: Any, name: str) -> Any:
     return getattr(event, name, None)
@@ -50,7 +52,9 @@ def main() -> int:
 
     try:
         while True:
-            for event in pygame.event.get():
+            # Blocks in SDL until an event arrives; NOEVENT means the wait timed out.
+            event = pygame.event.wait(_EVENT_WAIT_TIMEOUT_MS)
+            if event.type != pygame.NOEVENT:
                 details = {
                     "button": _event_value(event, "button"),
                     "axis": _event_value(event, "axis"),
@@ -66,8 +70,6 @@ def main() -> int:
 
             if args.seconds > 0 and time.monotonic() - started_at >= args.seconds:
                 break
-
-            time.sleep(0.01)
     except KeyboardInterrupt:
         pass
     finally:
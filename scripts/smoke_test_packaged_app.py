@@ -58,8 +58,8 @@ def main() -> int:
             cwd=exe_path.parent,
             env=env,
             timeout=timeout_seconds,
+            # Raw bytes; _format_output_block decodes once if output is reported.
             capture_output=True,
-            text=True,
             check=False,
         )
     except subprocess.TimeoutExpired as exc:
@@ -22,6 +22,7 @@ _LAZY_EXPORTS: dict[str, tuple[str, str]] = {
     "normalize_input_source": ("input_events", "normalize_input_source"),
     "normalize_keyboard_code": ("input_events", "normalize_keyboard_code"),
     "normalize_mouse_code": ("input_events", "normalize_mouse_code"),
+    "try_make_input_event": ("input_events", "try_make_input_event"),
     "GamepadDeviceInfo": ("input_router", "GamepadDeviceInfo"),
     "GamepadInputAdapter": ("input_router", "GamepadInputAdapter"),
     "InputAdapter": ("input_router", "InputAdapter"),
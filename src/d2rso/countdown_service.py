@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import bisect
+import heapq
+import math
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
 from time import monotonic
+from typing import NamedTuple
 
 
 class CountdownEventType(StrEnum):
@@ -15,9 +19,13 @@ class CountdownEventType(StrEnum):
     REMOVED = "removed"
 
 
-@dataclass(frozen=True, slots=True)
-class CountdownEvent:
-    """Immutable event payload emitted for countdown updates/removals."""
+class CountdownEvent(NamedTuple):
+    """
+    Immutable event payload emitted for countdown updates/removals.
+
+    A ``NamedTuple`` rather than a frozen dataclass: one event is built per active
+    countdown on every UI tick, and tuple construction is the cheapest option.
+    """
 
     type: CountdownEventType
     skill_id: int
@@ -26,6 +34,11 @@ class CountdownEvent:
     completed: bool = False
 
 
+# Per-tick construction sites use these module globals and positional fields.
+_UPDATED = CountdownEventType.UPDATED
+_REMOVED = CountdownEventType.REMOVED
+
+
 @dataclass(frozen=True, slots=True)
 class ActiveCountdown:
     """Read-only snapshot of one active countdown."""
@@ -64,17 +77,52 @@ class CountdownService:
     def __init__(self, *, time_provider: Callable[[], float] = monotonic) -> None:
         self._time_provider = time_provider
         self._states: dict[int, _CountdownState] = {}
-        self._subscribers: list[Callable[[CountdownEvent], None]] = []
+        # Min-heap of ``(ends_at, skill_id)`` used to find expirations without
+        # checking every state. Entries are never removed eagerly; stale ones are
+        # skipped when their ``ends_at`` no longer matches the live state.
+        self._expiry_heap: list[tuple[float, int]] = []
+        # Active skill IDs kept sorted on insert/remove so ``list_active`` never sorts.
+        self._sorted_ids: list[int] = []
+        # Rebuilt on (rare) subscription changes so emits can iterate it directly.
+        self._subscribers: tuple[Callable[[CountdownEvent], None], ...] = ()
+        self._batch_subscribers: tuple[
+            Callable[[Sequence[CountdownEvent]], None], ...
+        ] = ()
 
     def subscribe(self, callback: Callable[[CountdownEvent], None]) -> None:
         """Register an event subscriber if it is not already registered."""
         if callback not in self._subscribers:
-            self._subscribers.append(callback)
+            self._subscribers = (*self._subscribers, callback)
 
     def unsubscribe(self, callback: Callable[[CountdownEvent], None]) -> None:
         """Remove an event subscriber."""
         if callback in self._subscribers:
-            self._subscribers.remove(callback)
+            index = self._subscribers.index(callback)
+            self._subscribers = (
+                self._subscribers[:index] + self._subscribers[index + 1 :]
+            )
+
+    def subscribe_batch(
+        self, callback: Callable[[Sequence[CountdownEvent]], None]
+    ) -> None:
+        """
+        Register a subscriber that receives events in batches.
+
+        ``emit_updates`` delivers all events of one tick in a single call; refreshes
+        and removals are delivered as one-event batches.
+        """
+        if callback not in self._batch_subscribers:
+            self._batch_subscribers = (*self._batch_subscribers, callback)
+
+    def unsubscribe_batch(
+        self, callback: Callable[[Sequence[CountdownEvent]], None]
+    ) -> None:
+        """Remove a batch subscriber."""
+        if callback in self._batch_subscribers:
+            index = self._batch_subscribers.index(callback)
+            self._batch_subscribers = (
+                self._batch_subscribers[:index] + self._batch_subscribers[index + 1 :]
+            )
 
     @property
     def active_count(self) -> int:
@@ -97,10 +145,10 @@ class CountdownService:
         validated_duration = self._validate_duration(duration_seconds)
 
         if validated_duration == 0.0:
-            self._states.pop(skill_id, None)
+            self._pop_state(skill_id)
             return self._emit(
                 CountdownEvent(
-                    type=CountdownEventType.REMOVED,
+                    type=_REMOVED,
                     skill_id=skill_id,
                     duration_seconds=0.0,
                     remaining_seconds=0.0,
@@ -117,8 +165,10 @@ class CountdownService:
                 ends_at=resolved_now + validated_duration,
             )
             self._states[skill_id] = state
+            bisect.insort(self._sorted_ids, skill_id)
         else:
             state.refresh(validated_duration, resolved_now)
+        heapq.heappush(self._expiry_heap, (state.ends_at, skill_id))
 
         return self._emit(self._build_updated_event(state, resolved_now))
 
@@ -130,14 +180,14 @@ class CountdownService:
         now: float | None = None,
     ) -> CountdownEvent | None:
         """Remove an active countdown and emit a removal event."""
-        state = self._states.pop(skill_id, None)
+        state = self._pop_state(skill_id)
         if state is None:
             return None
 
         resolved_now = self._resolve_now(now)
         return self._emit(
             CountdownEvent(
-                type=CountdownEventType.REMOVED,
+                type=_REMOVED,
                 skill_id=skill_id,
                 duration_seconds=state.duration_seconds,
                 remaining_seconds=(
@@ -155,25 +205,25 @@ class CountdownService:
         emit ``REMOVED`` events marked as completed and are removed from active state.
         """
         resolved_now = self._resolve_now(now)
+        expired = self._pop_expired(resolved_now)
         events: list[CountdownEvent] = []
 
-        for skill_id, state in list(self._states.items()):
-            if state.remaining_seconds(resolved_now) <= 0.0:
-                self._states.pop(skill_id, None)
+        for skill_id, state in self._states.items():
+            if skill_id in expired:
                 events.append(
                     CountdownEvent(
-                        type=CountdownEventType.REMOVED,
-                        skill_id=skill_id,
-                        duration_seconds=state.duration_seconds,
-                        remaining_seconds=0.0,
-                        completed=True,
+                        _REMOVED, skill_id, state.duration_seconds, 0.0, True
                     )
                 )
             else:
                 events.append(self._build_updated_event(state, resolved_now))
 
-        for event in events:
-            self._emit(event)
+        # Drop expired states after the scan so the dict is never mutated mid-loop.
+        for skill_id in expired:
+            self._pop_state(skill_id)
+
+        if events:
+            self._emit_batch(tuple(events))
         return events
 
     def get_active(
@@ -183,51 +233,83 @@ class CountdownService:
         state = self._states.get(skill_id)
         if state is None:
             return None
+        return self._build_active_snapshot(state, self._resolve_now(now))
+
+    def list_active(self, *, now: float | None = None) -> list[ActiveCountdown]:
+        """Return snapshots for all active countdowns ordered by skill ID."""
         resolved_now = self._resolve_now(now)
+        states = self._states
+        return [
+            self._build_active_snapshot(states[skill_id], resolved_now)
+            for skill_id in self._sorted_ids
+        ]
+
+    @staticmethod
+    def _build_active_snapshot(state: _CountdownState, now: float) -> ActiveCountdown:
         return ActiveCountdown(
             skill_id=state.skill_id,
             duration_seconds=state.duration_seconds,
             started_at=state.started_at,
             ends_at=state.ends_at,
-            remaining_seconds=state.remaining_seconds(resolved_now),
+            remaining_seconds=state.remaining_seconds(now),
         )
 
-    def list_active(self, *, now: float | None = None) -> list[ActiveCountdown]:
-        """Return snapshots for all active countdowns ordered by skill ID."""
-        resolved_now = self._resolve_now(now)
-        return [
-            ActiveCountdown(
-                skill_id=state.skill_id,
-                duration_seconds=state.duration_seconds,
-                started_at=state.started_at,
-                ends_at=state.ends_at,
-                remaining_seconds=state.remaining_seconds(resolved_now),
-            )
-            for _, state in sorted(self._states.items())
-        ]
-
     def _build_updated_event(
         self, state: _CountdownState, now: float
     ) -> CountdownEvent:
         return CountdownEvent(
-            type=CountdownEventType.UPDATED,
-            skill_id=state.skill_id,
-            duration_seconds=state.duration_seconds,
-            remaining_seconds=state.remaining_seconds(now),
-            completed=False,
+            _UPDATED,
+            state.skill_id,
+            state.duration_seconds,
+            state.remaining_seconds(now),
+            False,
         )
 
+    def _pop_state(self, skill_id: int) -> _CountdownState | None:
+        state = self._states.pop(skill_id, None)
+        if state is not None:
+            sorted_ids = self._sorted_ids
+            del sorted_ids[bisect.bisect_left(sorted_ids, skill_id)]
+        return state
+
+    def _pop_expired(self, now: float) -> set[int]:
+        heap = self._expiry_heap
+        expired: set[int] = set()
+        while heap and heap[0][0] <= now:
+            ends_at, skill_id = heapq.heappop(heap)
+            state = self._states.get(skill_id)
+            if state is not None and state.ends_at == ends_at:
+                expired.add(skill_id)
+        return expired
+
     def _resolve_now(self, now: float | None) -> float:
-        return self._time_provider() if now is None else float(now)
+        if now is None:
+            return self._time_provider()
+        # Floats are the common case; only coerce other numeric types.
+        return now if type(now) is float else float(now)
 
     def _emit(self, event: CountdownEvent) -> CountdownEvent:
-        for callback in list(self._subscribers):
-            callback(event)
+        self._emit_batch((event,))
         return event
 
+    def _emit_batch(self, events: tuple[CountdownEvent, ...]) -> None:
+        for event in events:
+            for callback in self._subscribers:
+                callback(event)
+        for callback in self._batch_subscribers:
+            callback(events)
+
     @staticmethod
     def _validate_duration(duration_seconds: float) -> float:
-        value = float(duration_seconds)
+        value = (
+            duration_seconds
+            if type(duration_seconds) is float
+            else float(duration_seconds)
+        )
+        # NaN fails every comparison, so it would sit at the expiry heap's root
+        # and keep any countdown from expiring.
+        if not math.isfinite(value):
+            raise ValueError("duration_seconds must be finite")
         if value < 0:
             raise ValueError("duration_seconds must be >= 0")
         return value
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import re
+import sys
 import time
 from dataclasses import dataclass, field
-from enum import StrEnum
-from typing import Any
+from enum import Enum, StrEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
 class InputSource(StrEnum):
@@ -17,124 +19,172 @@ class InputSource(StrEnum):
     GAMEPAD = "gamepad"
 
 
-_FUNCTION_KEY_RE = re.compile(r"^f(?P<number>\d{1,2})$")
-_NUMPAD_KEY_RE = re.compile(r"^(?:numpad|num)(?P<number>\d)$")
-_D_KEY_RE = re.compile(r"^d(?P<number>\d)$")
-_BUTTONS_CODE_RE = re.compile(r"^buttons(?P<number>\d+)$")
-_GAMEPAD_BUTTON_RE = re.compile(r"^(?:gamepad)?button(?P<number>\d+)$")
-_DIRECT_INPUT_BUTTON_RE = re.compile(r"^joystickoffsetbuttons(?P<number>\d+)$")
-_KEYCODE_CHAR_RE = re.compile(r"""^keycode\(char=['"](?P<char>.)['"]\)$""", re.I)
-_KEYCODE_VK_RE = re.compile(r"^keycode\(vk=(?P<vk>\d+)\)$", re.I)
-
-_KEYBOARD_PUNCTUATION_ALIASES = {
-    ",": "OemComma",
-    "~": "OemTilde",
-    "[": "OemOpenBrackets",
-    "]": "OemCloseBrackets",
-    ":": "OemSemicolon",
-    ";": "OemSemicolon",
-    "'": "OemQuotes",
-    "+": "Add",
-    "-": "Subtract",
-}
-
-_KEYBOARD_ALIASES = {
-    "esc": "Escape",
-    "escape": "Escape",
-    "enter": "Return",
-    "return": "Return",
-    "tab": "Tab",
-    "back": "Back",
-    "backspace": "Back",
-    "lshift": "LShiftKey",
-    "leftshift": "LShiftKey",
-    "shiftl": "LShiftKey",
-    "shiftleft": "LShiftKey",
-    "shiftlkey": "LShiftKey",
-    "rshift": "RShiftKey",
-    "rightshift": "RShiftKey",
-    "shiftr": "RShiftKey",
-    "shiftright": "RShiftKey",
-    "shiftrkey": "RShiftKey",
-    "lalt": "LMenu",
-    "leftalt": "LMenu",
-    "altleft": "LMenu",
-    "altl": "LMenu",
-    "lmenu": "LMenu",
-    "ralt": "RMenu",
-    "rightalt": "RMenu",
-    "altright": "RMenu",
-    "altr": "RMenu",
-    "rmenu": "RMenu",
-    "lcontrol": "LControlKey",
-    "leftcontrol": "LControlKey",
-    "controlleft": "LControlKey",
-    "lctrl": "LControlKey",
-    "ctrll": "LControlKey",
-    "lcontrolkey": "LControlKey",
-    "rcontrol": "RControlKey",
-    "rightcontrol": "RControlKey",
-    "controlright": "RControlKey",
-    "rctrl": "RControlKey",
-    "ctrlr": "RControlKey",
-    "rcontrolkey": "RControlKey",
-    "comma": "OemComma",
-    "oemcomma": "OemComma",
-    "tilde": "OemTilde",
-    "oemtilde": "OemTilde",
-    "openbracket": "OemOpenBrackets",
-    "leftbracket": "OemOpenBrackets",
-    "oemopenbrackets": "OemOpenBrackets",
-    "closebracket": "OemCloseBrackets",
-    "rightbracket": "OemCloseBrackets",
-    "oemclosebrackets": "OemCloseBrackets",
-    "semicolon": "OemSemicolon",
-    "oemsemicolon": "OemSemicolon",
-    "quote": "OemQuotes",
-    "apostrophe": "OemQuotes",
-    "oemquotes": "OemQuotes",
-    "add": "Add",
-    "plus": "Add",
-    "subtract": "Subtract",
-    "minus": "Subtract",
-}
-
-_MOUSE_INDEX_TO_CODE = {
-    0: "MOUSE1",
-    1: "MOUSE2",
-    2: "MOUSE3",
-    3: "MOUSEX1",
-    4: "MOUSEX2",
-}
-
-_MOUSE_ALIASES = {
-    "mouse1": "MOUSE1",
-    "left": "MOUSE1",
-    "lbutton": "MOUSE1",
-    "buttonleft": "MOUSE1",
-    "button1": "MOUSE1",
-    "mouse2": "MOUSE2",
-    "right": "MOUSE2",
-    "rbutton": "MOUSE2",
-    "buttonright": "MOUSE2",
-    "button2": "MOUSE2",
-    "mouse3": "MOUSE3",
-    "middle": "MOUSE3",
-    "mbutton": "MOUSE3",
-    "buttonmiddle": "MOUSE3",
-    "button3": "MOUSE3",
-    "mousex1": "MOUSEX1",
-    "x1": "MOUSEX1",
-    "xbutton1": "MOUSEX1",
-    "buttonx1": "MOUSEX1",
-    "button4": "MOUSEX1",
-    "mousex2": "MOUSEX2",
-    "x2": "MOUSEX2",
-    "xbutton2": "MOUSEX2",
-    "buttonx2": "MOUSEX2",
-    "button5": "MOUSEX2",
-}
-
+# Normalizers cache on the extracted raw code (a str or int); a tracker only ever
+# sees a few dozen distinct codes, so hits dominate. The tables they consult are
+# read-only proxies, since a table mutated after import would disagree with
+# results already cached.
+_NORMALIZE_CACHE_SIZE = 1024
+_DIGITS = "0123456789"
+_KEYBOARD_CODE_PREFIXES = ("key.", "keys.", "keyboard.")
+# Numbered tokens ("f12", "numpad3", "buttons7") are matched by stripping the
+# trailing digits of a simplified token and looking the remaining stem up here.
+# Stems map to (max digit count, canonical names indexed by the number); the
+# names are built once so normalizers hand out shared strings instead of new
+# ones. A None name rejects that number.
+_F_KEY_NAMES = tuple(f"F{index}" for index in range(100))
+_DIGIT_KEY_NAMES = tuple(f"D{index}" for index in range(10))
+_NUMPAD_KEY_NAMES = tuple(f"NumPad{index}" for index in range(10))
+_KEYBOARD_NUMBERED_STEMS = MappingProxyType(
+    {
+        "f": (2, _F_KEY_NAMES),
+        "numpad": (1, _NUMPAD_KEY_NAMES),
+        "num": (1, _NUMPAD_KEY_NAMES),
+        "d": (1, _DIGIT_KEY_NAMES),
+        "": (1, _DIGIT_KEY_NAMES),
+    }
+)
+_GAMEPAD_BUTTON_STEMS = frozenset(
+    {"buttons", "button", "gamepadbutton", "joystickoffsetbuttons"}
+)
+# Canonical names for the common button indices. 48..57 are the ASCII digit
+# ordinals some backends report, so they fold onto Buttons0..Buttons9.
+_GAMEPAD_BUTTON_NAMES = tuple(
+    f"Buttons{index - 48 if 48 <= index <= 57 else index}" for index in range(256)
+)
+
+# Keyed on simplified tokens, plus the bare punctuation characters that simplify
+# to an empty token.
+_KEYBOARD_ALIASES = MappingProxyType(
+    {
+        ",": "OemComma",
+        "~": "OemTilde",
+        "[": "OemOpenBrackets",
+        "]": "OemCloseBrackets",
+        ":": "OemSemicolon",
+        ";": "OemSemicolon",
+        "'": "OemQuotes",
+        "+": "Add",
+        "-": "Subtract",
+        "esc": "Escape",
+        "escape": "Escape",
+        "enter": "Return",
+        "return": "Return",
+        "tab": "Tab",
+        "back": "Back",
+        "backspace": "Back",
+        "lshift": "LShiftKey",
+        "leftshift": "LShiftKey",
+        "shiftl": "LShiftKey",
+        "shiftleft": "LShiftKey",
+        "shiftlkey": "LShiftKey",
+        "lshiftkey": "LShiftKey",
+        "rshift": "RShiftKey",
+        "rightshift": "RShiftKey",
+        "shiftr": "RShiftKey",
+        "shiftright": "RShiftKey",
+        "shiftrkey": "RShiftKey",
+        "rshiftkey": "RShiftKey",
+        "lalt": "LMenu",
+        "leftalt": "LMenu",
+        "altleft": "LMenu",
+        "altl": "LMenu",
+        "lmenu": "LMenu",
+        "ralt": "RMenu",
+        "rightalt": "RMenu",
+        "altright": "RMenu",
+        "altr": "RMenu",
+        "rmenu": "RMenu",
+        "lcontrol": "LControlKey",
+        "leftcontrol": "LControlKey",
+        "controlleft": "LControlKey",
+        "lctrl": "LControlKey",
+        "ctrll": "LControlKey",
+        "lcontrolkey": "LControlKey",
+        "rcontrol": "RControlKey",
+        "rightcontrol": "RControlKey",
+        "controlright": "RControlKey",
+        "rctrl": "RControlKey",
+        "ctrlr": "RControlKey",
+        "rcontrolkey": "RControlKey",
+        "comma": "OemComma",
+        "oemcomma": "OemComma",
+        "tilde": "OemTilde",
+        "oemtilde": "OemTilde",
+        "openbracket": "OemOpenBrackets",
+        "leftbracket": "OemOpenBrackets",
+        "oemopenbrackets": "OemOpenBrackets",
+        "closebracket": "OemCloseBrackets",
+        "rightbracket": "OemCloseBrackets",
+        "oemclosebrackets": "OemCloseBrackets",
+        "semicolon": "OemSemicolon",
+        "oemsemicolon": "OemSemicolon",
+        "quote": "OemQuotes",
+        "apostrophe": "OemQuotes",
+        "oemquotes": "OemQuotes",
+        "add": "Add",
+        "plus": "Add",
+        "subtract": "Subtract",
+        "minus": "Subtract",
+    }
+)
+
+_MOUSE_INDEX_TO_CODE = ("MOUSE1", "MOUSE2", "MOUSE3", "MOUSEX1", "MOUSEX2")
+# "mouse<N>" counts from 1 while a bare "<N>" is a zero-based index.
+_MOUSE_NUMBERED_STEMS = MappingProxyType(
+    {
+        "": (sys.maxsize, _MOUSE_INDEX_TO_CODE),
+        "mouse": (sys.maxsize, (None, *_MOUSE_INDEX_TO_CODE)),
+        "mousex": (sys.maxsize, (None, "MOUSEX1", "MOUSEX2")),
+    }
+)
+
+_MOUSE_ALIASES = MappingProxyType(
+    {
+        "mouse1": "MOUSE1",
+        "left": "MOUSE1",
+        "lbutton": "MOUSE1",
+        "buttonleft": "MOUSE1",
+        "button1": "MOUSE1",
+        "mouse2": "MOUSE2",
+        "right": "MOUSE2",
+        "rbutton": "MOUSE2",
+        "buttonright": "MOUSE2",
+        "button2": "MOUSE2",
+        "mouse3": "MOUSE3",
+        "middle": "MOUSE3",
+        "mbutton": "MOUSE3",
+        "buttonmiddle": "MOUSE3",
+        "button3": "MOUSE3",
+        "mousex1": "MOUSEX1",
+        "x1": "MOUSEX1",
+        "xbutton1": "MOUSEX1",
+        "buttonx1": "MOUSEX1",
+        "button4": "MOUSEX1",
+        "mousex2": "MOUSEX2",
+        "x2": "MOUSEX2",
+        "xbutton2": "MOUSEX2",
+        "buttonx2": "MOUSEX2",
+        "button5": "MOUSEX2",
+    }
+)
+
+# Codes the normalizers already emit, so re-normalizing an existing event's code
+# returns immediately. Gamepad indices stop at 32: "Buttons48".."Buttons57" are
+# folded back onto 0..9 and must keep going through the normalizer.
+_CANONICAL_KEYBOARD_CODES = frozenset(
+    {
+        *_KEYBOARD_ALIASES.values(),
+        *_F_KEY_NAMES[1:25],
+        *_DIGIT_KEY_NAMES,
+        *_NUMPAD_KEY_NAMES,
+        *(chr(codepoint) for codepoint in range(65, 91)),
+    }
+)
+_CANONICAL_MOUSE_CODES = frozenset(_MOUSE_ALIASES.values())
+_CANONICAL_GAMEPAD_CODES = frozenset(_GAMEPAD_BUTTON_NAMES[:32])
+
+# A plain dict: normalize_input_source probes it on every str source, where a
+# proxy lookup would cost about twice as much.
 _SOURCE_ALIASES = {
     "keyboard": InputSource.KEYBOARD,
     "key": InputSource.KEYBOARD,
@@ -146,18 +196,75 @@ _SOURCE_ALIASES = {
     "joystick": InputSource.GAMEPAD,
     "pad": InputSource.GAMEPAD,
 }
+_get_source_alias = _SOURCE_ALIASES.get
+
+
+class _SimplifyTable(dict[int, str | None]):
+    """
+    ``str.translate`` table that lowercases and keeps only ``[a-z0-9]``.
+
+    Entries are computed on first use and cached. Non-ASCII code points are not
+    simply dropped because a few lowercase into ASCII (the Kelvin sign becomes
+    ``k``), matching the previous ``lower()`` + regex behaviour.
+    """
+
+    def __missing__(self, codepoint: int) -> str | None:
+        kept = "".join(
+            char for char in chr(codepoint).lower() if char in _SIMPLIFIED_CHARS
+        )
+        replacement = kept or None
+        self[codepoint] = replacement
+        return replacement
+
+
+_SIMPLIFIED_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_SIMPLIFY_TABLE = _SimplifyTable()
 
 
 def _simplify_token(value: str) -> str:
-    return re.sub(r"[^a-z0-9]+", "", value.strip().lower())
+    return value.translate(_SIMPLIFY_TABLE)
+
+
+def _split_trailing_number(token: str) -> tuple[str, str]:
+    stem = token.rstrip(_DIGITS)
+    return stem, token[len(stem) :]
+
+
+def _lookup_numbered_token(
+    token: str, stems: Mapping[str, tuple[int, tuple[str | None, ...]]]
+) -> str | None:
+    stem, digits = _split_trailing_number(token)
+    if not digits:
+        return None
+    numbered = stems.get(stem)
+    if numbered is None or len(digits) > numbered[0]:
+        return None
+    index = int(digits)
+    names = numbered[1]
+    return names[index] if index < len(names) else None
 
 
 def _extract_raw_code(value: Any) -> str | int | None:
-    if value is None or isinstance(value, bool):
+    value_type = type(value)
+    if value_type is str or value_type is int:
+        return value
+    if value is None or value_type is bool:
         return None
     if isinstance(value, (str, int)):
         return value
+    if isinstance(value, Enum):
+        return _extract_enum_raw_code(value)
+    return _extract_attribute_raw_code(value)
+
+
+# pynput's special keys (Key.shift, Key.f1, ...) are Enum members: immutable
+# singletons, so their attribute probe (which misses on "char") is done once.
+@lru_cache(maxsize=256)
+def _extract_enum_raw_code(value: Enum) -> str | int | None:
+    return _extract_attribute_raw_code(value)
 
+
+def _extract_attribute_raw_code(value: Any) -> str | int | None:
     for attribute in ("char", "name"):
         attribute_value = getattr(value, attribute, None)
         if isinstance(attribute_value, str) and attribute_value.strip():
@@ -174,24 +281,31 @@ def _extract_raw_code(value: Any) -> str | int | None:
 
 def normalize_input_source(source: InputSource | str) -> InputSource:
     """Normalize source aliases to one of the supported input sources."""
-    if isinstance(source, InputSource):
+    # Enums with members cannot be subclassed, so an exact type check suffices.
+    if type(source) is InputSource:
         return source
+    if type(source) is str:
+        resolved = _get_source_alias(source)
+        if resolved is not None:
+            return resolved
+
+    resolved = _lookup_input_source(str(source))
+    if resolved is not None:
+        return resolved
 
-    key = _simplify_token(str(source))
-    if not key:
+    if not _simplify_token(str(source)):
         raise ValueError("Input source cannot be empty.")
+    raise ValueError(f"Unsupported input source: {source!r}")
+
 
-    resolved = _SOURCE_ALIASES.get(key)
-    if resolved is None:
-        raise ValueError(f"Unsupported input source: {source!r}")
-    return resolved
+@lru_cache(maxsize=64)
+def _lookup_input_source(text: str) -> InputSource | None:
+    return _get_source_alias(_simplify_token(text))
 
 
-def _normalize_buttons_index(value: int) -> str | None:
-    if 48 <= value <= 57:
-        return f"Buttons{value - 48}"
-    if value >= 0:
-        return f"Buttons{value}"
+def _mouse_code_for_index(index: int) -> str | None:
+    if 0 <= index < len(_MOUSE_INDEX_TO_CODE):
+        return _MOUSE_INDEX_TO_CODE[index]
     return None
 
 
@@ -200,11 +314,15 @@ def infer_input_source_from_code(code: Any) -> InputSource | None:
     raw = _extract_raw_code(code)
     if raw is None:
         return None
+    return _infer_input_source_raw(raw)
 
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _infer_input_source_raw(raw: str | int) -> InputSource | None:
     if isinstance(raw, int):
-        if raw in _MOUSE_INDEX_TO_CODE:
+        if 0 <= raw < len(_MOUSE_INDEX_TO_CODE):
             return InputSource.MOUSE
-        if _normalize_buttons_index(raw) is not None:
+        if raw >= 0:
             return InputSource.GAMEPAD
         return None
 
@@ -215,11 +333,8 @@ def infer_input_source_from_code(code: Any) -> InputSource | None:
 
     if token in _MOUSE_ALIASES or token.startswith("mouse"):
         return InputSource.MOUSE
-    if (
-        _BUTTONS_CODE_RE.fullmatch(token)
-        or _GAMEPAD_BUTTON_RE.fullmatch(token)
-        or _DIRECT_INPUT_BUTTON_RE.fullmatch(token)
-    ):
+    stem, digits = _split_trailing_number(token)
+    if digits and stem in _GAMEPAD_BUTTON_STEMS:
         return InputSource.GAMEPAD
     if token.startswith("joystickoffsetbuttons"):
         return InputSource.GAMEPAD
@@ -232,69 +347,70 @@ def normalize_keyboard_code(raw_code: Any) -> str | None:
     raw = _extract_raw_code(raw_code)
     if raw is None:
         return None
+    return _keyboard_code_from_raw(raw)
+
 
+def _keyboard_code_from_raw(raw: str | int) -> str | None:
+    if raw in _CANONICAL_KEYBOARD_CODES:
+        return raw
+    return _normalize_keyboard_raw(raw)
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_keyboard_raw(raw: str | int) -> str | None:
     if isinstance(raw, int):
         if 65 <= raw <= 90:
             return chr(raw)
         if 48 <= raw <= 57:
-            return f"D{raw - 48}"
+            return _DIGIT_KEY_NAMES[raw - 48]
         return None
 
     text = raw.strip()
     if not text:
         return None
 
-    if text in _KEYBOARD_PUNCTUATION_ALIASES:
-        return _KEYBOARD_PUNCTUATION_ALIASES[text]
-
     lowered = text.lower()
-    for prefix in ("key.", "keys.", "keyboard."):
-        if lowered.startswith(prefix):
-            text = text[len(prefix) :]
-            lowered = text.lower()
-            break
-
-    keycode_char_match = _KEYCODE_CHAR_RE.fullmatch(lowered)
-    if keycode_char_match is not None:
-        text = keycode_char_match.group("char")
-    else:
-        keycode_vk_match = _KEYCODE_VK_RE.fullmatch(lowered)
-        if keycode_vk_match is not None:
-            return normalize_keyboard_code(int(keycode_vk_match.group("vk")))
-
-    if len(text) == 3 and text[0] == text[-1] and text[0] in {"'", '"'}:
+    if lowered.startswith(_KEYBOARD_CODE_PREFIXES):
+        # Every prefix ends at its first ".", and is ASCII, so the cut lines up in
+        # both the original and the lowered text.
+        cut = lowered.index(".") + 1
+        text = text[cut:]
+        lowered = lowered[cut:]
+
+    if lowered.startswith("keycode(") and lowered.endswith(")"):
+        # pynput's KeyCode repr: keycode(char='a') or keycode(vk=65).
+        payload = lowered[8:-1]
+        if (
+            len(payload) == 8
+            and payload.startswith("char=")
+            and payload[5] in "'\""
+            and payload[7] in "'\""
+            and payload[6] != "\n"
+        ):
+            text = payload[6]
+        elif payload.startswith("vk=") and payload[3:].isdecimal():
+            return _normalize_keyboard_raw(int(payload[3:]))
+
+    if len(text) == 3 and text[0] == text[-1] and text[0] in "'\"":
         text = text[1]
 
-    if text in _KEYBOARD_PUNCTUATION_ALIASES:
-        return _KEYBOARD_PUNCTUATION_ALIASES[text]
-
     token = _simplify_token(text)
-    if not token:
-        return None
-
-    alias = _KEYBOARD_ALIASES.get(token)
+    # Punctuation simplifies away entirely, so it is looked up by its raw text.
+    alias = _KEYBOARD_ALIASES.get(token or text)
     if alias is not None:
         return alias
+    if not token:
+        return None
 
-    function_match = _FUNCTION_KEY_RE.fullmatch(token)
-    if function_match is not None:
-        return f"F{int(function_match.group('number'))}"
-
-    numpad_match = _NUMPAD_KEY_RE.fullmatch(token)
-    if numpad_match is not None:
-        return f"NumPad{int(numpad_match.group('number'))}"
-
-    d_key_match = _D_KEY_RE.fullmatch(token)
-    if d_key_match is not None:
-        return f"D{int(d_key_match.group('number'))}"
+    numbered = _lookup_numbered_token(token, _KEYBOARD_NUMBERED_STEMS)
+    if numbered is not None:
+        return numbered
 
     if len(token) == 1 and token.isalpha():
         return token.upper()
-    if len(token) == 1 and token.isdigit():
-        return f"D{token}"
 
     if token.startswith("vk") and token[2:].isdigit():
-        return normalize_keyboard_code(int(token[2:]))
+        return _normalize_keyboard_raw(int(token[2:]))
 
     return None
 
@@ -304,9 +420,19 @@ def normalize_mouse_code(raw_code: Any) -> str | None:
     raw = _extract_raw_code(raw_code)
     if raw is None:
         return None
+    return _mouse_code_from_raw(raw)
+
 
+def _mouse_code_from_raw(raw: str | int) -> str | None:
+    if raw in _CANONICAL_MOUSE_CODES:
+        return raw
+    return _normalize_mouse_raw(raw)
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_mouse_raw(raw: str | int) -> str | None:
     if isinstance(raw, int):
-        return _MOUSE_INDEX_TO_CODE.get(raw)
+        return _mouse_code_for_index(raw)
 
     token = _simplify_token(raw)
     if not token:
@@ -315,19 +441,7 @@ def normalize_mouse_code(raw_code: Any) -> str | None:
     if token in _MOUSE_ALIASES:
         return _MOUSE_ALIASES[token]
 
-    if token.isdigit():
-        return _MOUSE_INDEX_TO_CODE.get(int(token))
-
-    if token.startswith("mousex") and token[6:].isdigit():
-        index = int(token[6:])
-        if index in {1, 2}:
-            return f"MOUSEX{index}"
-
-    if token.startswith("mouse") and token[5:].isdigit():
-        index = int(token[5:])
-        return _MOUSE_INDEX_TO_CODE.get(index - 1)
-
-    return None
+    return _lookup_numbered_token(token, _MOUSE_NUMBERED_STEMS)
 
 
 def normalize_gamepad_code(raw_code: Any) -> str | None:
@@ -335,35 +449,33 @@ def normalize_gamepad_code(raw_code: Any) -> str | None:
     raw = _extract_raw_code(raw_code)
     if raw is None:
         return None
+    return _gamepad_code_from_raw(raw)
 
-    if isinstance(raw, int):
-        return _normalize_buttons_index(raw)
-
-    token = _simplify_token(raw)
-    if not token:
-        return None
-
-    if token.startswith("joystickoffset"):
-        token = token[len("joystickoffset") :]
-
-    buttons_match = _BUTTONS_CODE_RE.fullmatch(token)
-    if buttons_match is not None:
-        return _normalize_buttons_index(int(buttons_match.group("number")))
-
-    gamepad_match = _GAMEPAD_BUTTON_RE.fullmatch(token)
-    if gamepad_match is not None:
-        return _normalize_buttons_index(int(gamepad_match.group("number")))
 
-    direct_input_match = _DIRECT_INPUT_BUTTON_RE.fullmatch(token)
-    if direct_input_match is not None:
-        return _normalize_buttons_index(int(direct_input_match.group("number")))
+def _gamepad_code_from_raw(raw: str | int) -> str | None:
+    if raw in _CANONICAL_GAMEPAD_CODES:
+        return raw
+    return _normalize_gamepad_raw(raw)
 
-    if token.startswith("button") and token[6:].isdigit():
-        return _normalize_buttons_index(int(token[6:]))
-
-    if token.isdigit():
-        return _normalize_buttons_index(int(token))
 
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_gamepad_raw(raw: str | int) -> str | None:
+    if isinstance(raw, int):
+        index = raw
+    else:
+        token = _simplify_token(raw)
+        if token.startswith("joystickoffset"):
+            token = token[len("joystickoffset") :]
+
+        stem, digits = _split_trailing_number(token)
+        if not digits or (stem and stem not in _GAMEPAD_BUTTON_STEMS):
+            return None
+        index = int(digits)
+
+    if 0 <= index < len(_GAMEPAD_BUTTON_NAMES):
+        return _GAMEPAD_BUTTON_NAMES[index]
+    if index >= 0:
+        return f"Buttons{index}"
     return None
 
 
@@ -373,19 +485,22 @@ def normalize_input_code(
     source: InputSource | str | None = None,
 ) -> str | None:
     """Normalize a raw input code, optionally with explicit source hint."""
-    resolved_source = (
-        normalize_input_source(source)
-        if source is not None
-        else infer_input_source_from_code(raw_code)
-    )
-    if resolved_source is None:
+    resolved_source = normalize_input_source(source) if source is not None else None
+    # Extract once; adapter objects would otherwise be probed for inference and
+    # again for normalization.
+    raw = _extract_raw_code(raw_code)
+    if raw is None:
         return None
+    if resolved_source is None:
+        resolved_source = _infer_input_source_raw(raw)
+        if resolved_source is None:
+            return None
 
     if resolved_source == InputSource.KEYBOARD:
-        return normalize_keyboard_code(raw_code)
+        return _keyboard_code_from_raw(raw)
     if resolved_source == InputSource.MOUSE:
-        return normalize_mouse_code(raw_code)
-    return normalize_gamepad_code(raw_code)
+        return _mouse_code_from_raw(raw)
+    return _gamepad_code_from_raw(raw)
 
 
 @dataclass(frozen=True, slots=True)
@@ -394,20 +509,49 @@ class InputEvent:
 
     code: str
     source: InputSource | str
-    timestamp: float = field(default_factory=time.time)
+    # Monotonic, like CountdownService's clock, so wall-clock jumps cannot reorder
+    # events.
+    timestamp: float = field(default_factory=time.monotonic)
     pressed: bool = True
 
     def __post_init__(self) -> None:
-        normalized_source = normalize_input_source(self.source)
-        normalized_code = normalize_input_code(self.code, source=normalized_source)
-        if normalized_code is None:
-            raise ValueError(
-                f"Could not normalize input code {self.code!r} for {normalized_source}."
-            )
+        normalized_code, normalized_source = _normalize_event_fields(
+            self.code, self.source
+        )
         object.__setattr__(self, "source", normalized_source)
         object.__setattr__(self, "code", normalized_code)
-        object.__setattr__(self, "timestamp", float(self.timestamp))
-        object.__setattr__(self, "pressed", bool(self.pressed))
+        if type(self.timestamp) is not float:
+            object.__setattr__(self, "timestamp", float(self.timestamp))
+        if type(self.pressed) is not bool:
+            object.__setattr__(self, "pressed", bool(self.pressed))
+
+    @classmethod
+    def _unchecked(
+        cls,
+        code: str,
+        source: InputSource,
+        timestamp: float,
+        pressed: bool,
+    ) -> InputEvent:
+        """Build an event from already-normalized fields, skipping __post_init__."""
+        event = cls.__new__(cls)
+        object.__setattr__(event, "code", code)
+        object.__setattr__(event, "source", source)
+        object.__setattr__(event, "timestamp", timestamp)
+        object.__setattr__(event, "pressed", pressed)
+        return event
+
+
+def _normalize_event_fields(
+    code: Any, source: InputSource | str
+) -> tuple[str, InputSource]:
+    normalized_source = normalize_input_source(source)
+    normalized_code = normalize_input_code(code, source=normalized_source)
+    if normalized_code is None:
+        raise ValueError(
+            f"Could not normalize input code {code!r} for {normalized_source}."
+        )
+    return normalized_code, normalized_source
 
 
 def make_input_event(
@@ -418,9 +562,38 @@ def make_input_event(
     pressed: bool = True,
 ) -> InputEvent:
     """Create a normalized input event."""
+    normalized_code, normalized_source = _normalize_event_fields(code, source)
+    return _stamp_event(normalized_code, normalized_source, timestamp, pressed)
+
+
+def try_make_input_event(
+    code: Any,
+    *,
+    source: InputSource | str,
+    timestamp: float | None = None,
+    pressed: bool = True,
+) -> InputEvent | None:
+    """Create a normalized input event, or return None for an unsupported code."""
+    normalized_source = normalize_input_source(source)
+    normalized_code = normalize_input_code(code, source=normalized_source)
+    if normalized_code is None:
+        return None
+    return _stamp_event(normalized_code, normalized_source, timestamp, pressed)
+
+
+def _stamp_event(
+    code: str,
+    source: InputSource,
+    timestamp: float | None,
+    pressed: bool,
+) -> InputEvent:
     if timestamp is None:
-        return InputEvent(code=code, source=source, pressed=pressed)
-    return InputEvent(code=code, source=source, timestamp=timestamp, pressed=pressed)
+        timestamp = time.monotonic()
+    elif type(timestamp) is not float:
+        timestamp = float(timestamp)
+    if type(pressed) is not bool:
+        pressed = bool(pressed)
+    return InputEvent._unchecked(code, source, timestamp, pressed)
 
 
 def keyboard_event(
@@ -481,4 +654,5 @@ __all__ = [
     "normalize_input_source",
     "normalize_keyboard_code",
     "normalize_mouse_code",
+    "try_make_input_event",
 ]
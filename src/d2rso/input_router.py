@@ -3,29 +3,79 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import os
 import platform
 import threading
-from collections.abc import Callable, Sequence
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from dataclasses import dataclass
-from queue import Empty, Queue
 from typing import Any, Protocol
 
-from .input_events import InputEvent, gamepad_event, keyboard_event, mouse_event
+from .input_events import (
+    InputEvent,
+    InputSource,
+    infer_input_source_from_code,
+    normalize_keyboard_code,
+    try_make_input_event,
+)
 from .models import SkillItem
 from .tracker_engine import TrackerInputEngine
 
-_QUEUE_TIMEOUT_SECONDS = 0.05
+# Pending routed events; once full, the oldest event is dropped.
+_EVENT_BUFFER_CAPACITY = 1024
 _GAMEPAD_POLL_INTERVAL_SECONDS = 0.01
+# Consecutive empty polls back off from the poll interval up to about one
+# 60 Hz frame.
+_GAMEPAD_IDLE_POLL_INTERVAL_SECONDS = 1 / 60
+_GAMEPAD_MAX_IDLE_BACKOFF_SHIFT = 4
+# With pygame's event.wait available an idle loop blocks in SDL instead. Stop
+# posts a wake event; the timeout is only a backstop if that post fails.
+_GAMEPAD_EVENT_WAIT_TIMEOUT_MS = 50
 _LISTENER_JOIN_TIMEOUT_SECONDS = 1.0
-_GAMEPAD_TRIGGER_AXIS_TO_BUTTON = {
-    4: 4,
-    5: 5,
+_WINDOWS_THREAD_PRIORITY_ABOVE_NORMAL = 1
+_DARWIN_QOS_CLASS_USER_INTERACTIVE = 0x21
+# Canonical keyboard codes are .NET Keys names, whose values are the Windows
+# virtual-key codes reported to pynput's low-level hook. pynput normalizes by
+# the typed character, so a code lists every key that can produce it: numpad
+# digits type the same character as the main row. Codes left out, such as
+# Add/Subtract and the Oem* keys, come from layout-dependent keys and turn the
+# filter off instead.
+_WIN32_VIRTUAL_KEY_CODES: dict[str, tuple[int, ...]] = {
+    **{chr(letter): (letter,) for letter in range(ord("A"), ord("Z") + 1)},
+    **{f"D{digit}": (0x30 + digit, 0x60 + digit) for digit in range(10)},
+    **{f"NumPad{digit}": (0x60 + digit,) for digit in range(10)},
+    **{f"F{number}": (0x6F + number,) for number in range(1, 25)},
+    "Back": (0x08,),
+    "Tab": (0x09,),
+    "Return": (0x0D,),
+    "Escape": (0x1B,),
+    "LShiftKey": (0xA0,),
+    "RShiftKey": (0xA1,),
+    "LControlKey": (0xA2,),
+    "RControlKey": (0xA3,),
+    "LMenu": (0xA4,),
+    "RMenu": (0xA5,),
 }
+# Default adapter event factories return None for unsupported codes, so common
+# unmapped keys are dropped without raising and catching a ValueError.
+_try_keyboard_event = functools.partial(
+    try_make_input_event, source=InputSource.KEYBOARD
+)
+_try_mouse_event = functools.partial(try_make_input_event, source=InputSource.MOUSE)
+_try_gamepad_event = functools.partial(try_make_input_event, source=InputSource.GAMEPAD)
+# Indexed by axis number; -1 marks axes that are not triggers.
+_GAMEPAD_TRIGGER_AXIS_TO_BUTTON = (-1, -1, -1, -1, 4, 5)
+_GAMEPAD_TRIGGER_STATE_SIZE = max(_GAMEPAD_TRIGGER_AXIS_TO_BUTTON) + 1
 _GAMEPAD_TRIGGER_PRESS_THRESHOLD = 0.5
 _GAMEPAD_TRIGGER_RELEASE_THRESHOLD = 0.25
 
 
+@contextlib.contextmanager
+def _safe_darwin_keycode_context() -> Iterator[tuple[None, None]]:
+    yield (None, None)
+
+
 def _apply_darwin_pynput_keyboard_workaround(keyboard_module: Any) -> None:
     """
     Patch pynput's Darwin keyboard listener to avoid background-thread TIS calls.
@@ -41,12 +91,38 @@ def _apply_darwin_pynput_keyboard_workaround(keyboard_module: Any) -> None:
     backend = getattr(keyboard_module, "_darwin", None)
     if backend is None:
         return
+    if getattr(backend, "keycode_context", None) is _safe_darwin_keycode_context:
+        return
+
+    backend.keycode_context = _safe_darwin_keycode_context
 
-    @contextlib.contextmanager
-    def _safe_keycode_context():
-        yield (None, None)
 
-    backend.keycode_context = _safe_keycode_context
+def _raise_current_thread_priority() -> None:
+    """
+    Hint to the OS scheduler that the calling input thread is latency sensitive.
+
+    Windows gets an above-normal thread priority and macOS the user-interactive
+    QoS class, so these threads are not queued behind Qt painting. Linux is left
+    alone: real-time scheduling needs CAP_SYS_NICE and could starve the desktop.
+    Failures are ignored; this is only a hint.
+    """
+    system = platform.system()
+    if system not in ("Windows", "Darwin"):
+        return
+    try:
+        import ctypes
+
+        if system == "Windows":
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(
+                kernel32.GetCurrentThread(), _WINDOWS_THREAD_PRIORITY_ABOVE_NORMAL
+            )
+        else:
+            ctypes.CDLL(None).pthread_set_qos_class_self_np(
+                _DARWIN_QOS_CLASS_USER_INTERACTIVE, 0
+            )
+    except Exception:
+        pass
 
 
 def _configure_pygame_headless_if_needed(pygame_module: Any | None = None) -> None:
@@ -73,6 +149,26 @@ def _configure_pygame_headless_if_needed(pygame_module: Any | None = None) -> No
     os.environ["SDL_VIDEODRIVER"] = "dummy"
 
 
+def _set_pygame_event_filter(
+    event_module: Any, allowed_types: Sequence[Any] | None
+) -> bool:
+    """
+    Limit the SDL event queue to ``allowed_types``, or lift the limit for None.
+
+    Returns False when the event module has no filtering support.
+    """
+    set_allowed = getattr(event_module, "set_allowed", None)
+    set_blocked = getattr(event_module, "set_blocked", None)
+    if not callable(set_allowed) or not callable(set_blocked):
+        return False
+    if allowed_types is None:
+        set_allowed(None)
+    else:
+        set_blocked(None)
+        set_allowed(list(allowed_types))
+    return True
+
+
 def _resolve_pygame_module(pygame_module: Any | None = None) -> Any:
     if pygame_module is None:
         _configure_pygame_headless_if_needed()
@@ -188,6 +284,26 @@ def list_connected_gamepads(
                     pass
 
 
+@dataclass(frozen=True, slots=True)
+class _JoystickHandle:
+    """Opened joystick with its ``quit`` method resolved once at open time."""
+
+    joystick: Any
+    quit: Callable[[], Any] | None
+
+
+def _open_joystick_handle(joystick_module: Any, index: int) -> _JoystickHandle:
+    joystick = joystick_module.Joystick(index)
+    init_fn = getattr(joystick, "init", None)
+    if callable(init_fn):
+        init_fn()
+    quit_fn = getattr(joystick, "quit", None)
+    return _JoystickHandle(
+        joystick=joystick,
+        quit=quit_fn if callable(quit_fn) else None,
+    )
+
+
 class InputAdapter(Protocol):
     """Interface implemented by input adapters managed by InputRouter."""
 
@@ -212,27 +328,56 @@ class KeyboardInputAdapter:
         listener_factory: (
             Callable[[Callable[[Any], None], Callable[[Any], None]], Any] | None
         ) = None,
-        event_factory: Callable[..., InputEvent] = keyboard_event,
+        event_factory: Callable[..., InputEvent | None] = _try_keyboard_event,
         event_callback: Callable[[InputEvent], None] | None = None,
         error_callback: Callable[[Exception], None] | None = None,
     ) -> None:
-        self._listener_factory = listener_factory or _default_keyboard_listener_factory
+        self._listener_factory = listener_factory or functools.partial(
+            _default_keyboard_listener_factory,
+            win32_event_filter=self._win32_event_filter,
+        )
         self._event_factory = event_factory
-        self._event_callback = event_callback
+        self._event_callback = (
+            event_callback if event_callback is not None else _ignore_event
+        )
         self._error_callback = error_callback
         self._listener: Any | None = None
         self._is_running = False
+        # Physical keys currently held down, mapped to the code they pressed;
+        # OS autorepeat presses of a held key are dropped until its release.
+        self._held_keys: dict[Any, str] = {}
+        # Windows virtual-key codes let through by the listener's hook filter;
+        # None lets every key through.
+        self._allowed_virtual_keys: frozenset[int] | None = None
 
     @property
     def is_running(self) -> bool:
         return self._is_running
 
     def set_event_callback(self, callback: Callable[[InputEvent], None] | None) -> None:
-        self._event_callback = callback
+        self._event_callback = callback if callback is not None else _ignore_event
+
+    def set_key_filter(self, virtual_keys: Iterable[int] | None) -> None:
+        """
+        Only let these Windows virtual-key codes reach the press/release hooks.
+
+        The filter runs inside pynput's Windows hook before the key is
+        translated, so other keys cost no callback or normalization work. It
+        can change while listening; ``None`` lets every key through.
+        """
+        self._allowed_virtual_keys = (
+            frozenset(virtual_keys) if virtual_keys is not None else None
+        )
+
+    def _win32_event_filter(self, _msg: Any, data: Any) -> bool:
+        allowed = self._allowed_virtual_keys
+        return allowed is None or data.vkCode in allowed
 
     def start(self) -> None:
         if self._is_running:
             return
+        # Releases that happened while stopped were never seen.
+        self._held_keys.clear()
         listener = self._listener_factory(self._on_press, self._on_release)
         try:
             listener.start()
@@ -259,12 +404,30 @@ class KeyboardInputAdapter:
         self._emit_normalized(key, pressed=False)
 
     def _emit_normalized(self, raw_code: Any, *, pressed: bool) -> None:
-        callback = self._event_callback
-        if callback is None:
-            return
+        held_keys = self._held_keys
+        identity = _physical_key_identity(raw_code)
         try:
-            callback(self._event_factory(raw_code, pressed=pressed))
+            if pressed and identity in held_keys:
+                return
+            if not pressed:
+                # A modifier can change the character a key releases with
+                # (shift+1 releases as "!"), so the release is matched by
+                # physical key before it is normalized, or even if it cannot be.
+                held_keys.pop(identity, None)
+            event = self._event_factory(raw_code, pressed=pressed)
+            if event is None:
+                return
+            if pressed:
+                held_keys[identity] = event.code
+            elif event.code in held_keys.values():
+                # Without a virtual-key code, a key pressed as "a" may release
+                # as "A"; drop whichever key pressed the same code.
+                for held_key, code in list(held_keys.items()):
+                    if code == event.code:
+                        del held_keys[held_key]
+            self._event_callback(event)
         except ValueError:
+            # Custom factories may still reject unsupported codes by raising.
             return
         except Exception as exc:
             _handle_adapter_exception(exc, self._error_callback)
@@ -279,13 +442,15 @@ class MouseInputAdapter:
         listener_factory: (
             Callable[[Callable[[int, int, Any, bool], None]], Any] | None
         ) = None,
-        event_factory: Callable[..., InputEvent] = mouse_event,
+        event_factory: Callable[..., InputEvent | None] = _try_mouse_event,
         event_callback: Callable[[InputEvent], None] | None = None,
         error_callback: Callable[[Exception], None] | None = None,
     ) -> None:
         self._listener_factory = listener_factory or _default_mouse_listener_factory
         self._event_factory = event_factory
-        self._event_callback = event_callback
+        self._event_callback = (
+            event_callback if event_callback is not None else _ignore_event
+        )
         self._error_callback = error_callback
         self._listener: Any | None = None
         self._is_running = False
@@ -295,7 +460,7 @@ class MouseInputAdapter:
         return self._is_running
 
     def set_event_callback(self, callback: Callable[[InputEvent], None] | None) -> None:
-        self._event_callback = callback
+        self._event_callback = callback if callback is not None else _ignore_event
 
     def start(self) -> None:
         if self._is_running:
@@ -323,12 +488,12 @@ class MouseInputAdapter:
         self._emit_normalized(button, pressed=pressed)
 
     def _emit_normalized(self, raw_code: Any, *, pressed: bool) -> None:
-        callback = self._event_callback
-        if callback is None:
-            return
         try:
-            callback(self._event_factory(raw_code, pressed=pressed))
+            event = self._event_factory(raw_code, pressed=pressed)
+            if event is not None:
+                self._event_callback(event)
         except ValueError:
+            # Custom factories may still reject unsupported codes by raising.
             return
         except Exception as exc:
             _handle_adapter_exception(exc, self._error_callback)
@@ -342,37 +507,63 @@ class GamepadInputAdapter:
         *,
         pygame_module: Any | None = None,
         thread_factory: Callable[..., threading.Thread] = threading.Thread,
-        event_factory: Callable[..., InputEvent] = gamepad_event,
+        event_factory: Callable[..., InputEvent | None] = _try_gamepad_event,
         event_callback: Callable[[InputEvent], None] | None = None,
         error_callback: Callable[[Exception], None] | None = None,
         poll_interval_seconds: float = _GAMEPAD_POLL_INTERVAL_SECONDS,
+        idle_poll_interval_seconds: float = _GAMEPAD_IDLE_POLL_INTERVAL_SECONDS,
     ) -> None:
         self._pygame_module = pygame_module
         self._thread_factory = thread_factory
         self._event_factory = event_factory
-        self._event_callback = event_callback
+        self._event_callback = (
+            event_callback if event_callback is not None else _ignore_event
+        )
         self._error_callback = error_callback
         self._poll_interval_seconds = max(0.001, float(poll_interval_seconds))
+        self._idle_poll_interval_seconds = max(
+            self._poll_interval_seconds, float(idle_poll_interval_seconds)
+        )
         self._thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
+        # Plain flag: the loop only reads it between polls and waits, and every
+        # blocking wait is cut short by _signal_stop.
+        self._stop_requested = False
+        # Held while the poll loop runs and released on stop. The loop sleeps by
+        # acquiring it with a timeout: a single C-level wait, where Event.wait
+        # allocates and juggles a Condition waiter lock every tick.
+        self._stop_lock = threading.Lock()
         self._is_running = False
-        self._joysticks: list[Any] = []
+        self._joysticks: list[_JoystickHandle] = []
         self._owns_pygame_init = False
         self._owns_joystick_init = False
-        self._axis_button_states: dict[int, bool] = {}
+        # Per joystick instance id, one byte per virtual trigger button: 1 while
+        # it is held. Keeping pads apart stops one pad's trigger from masking
+        # or releasing another's.
+        self._axis_button_states: dict[Any, bytearray] = {}
+        self._event_get: Callable[[], Any] | None = None
+        self._event_wait: Callable[[int], Any] | None = None
+        self._no_event_type: Any = None
+        self._wake_event_type: Any = None
+        self._event_handlers: dict[Any, Callable[[Any], None]] = {}
+        self._filters_event_queue = False
 
     @property
     def is_running(self) -> bool:
         return self._is_running
 
     def set_event_callback(self, callback: Callable[[InputEvent], None] | None) -> None:
-        self._event_callback = callback
+        self._event_callback = callback if callback is not None else _ignore_event
 
     def start(self) -> None:
         if self._is_running:
             return
 
-        self._stop_event.clear()
+        # A previous loop thread may still be passing through _wait_for_stop.
+        # Without the lock the new loop would see a stop request at once and
+        # exit while the adapter reports itself running.
+        if not self._stop_lock.acquire(timeout=_LISTENER_JOIN_TIMEOUT_SECONDS):
+            raise RuntimeError("previous gamepad poll loop is still stopping")
+        self._stop_requested = False
         thread: threading.Thread | None = None
         try:
             self._initialize_runtime()
@@ -385,7 +576,7 @@ class GamepadInputAdapter:
         except Exception:
             self._is_running = False
             self._thread = None
-            self._stop_event.set()
+            self._signal_stop()
             self._cleanup_runtime()
             raise
 
@@ -397,7 +588,7 @@ class GamepadInputAdapter:
             return
 
         self._is_running = False
-        self._stop_event.set()
+        self._signal_stop()
 
         thread = self._thread
         self._thread = None
@@ -423,82 +614,196 @@ class GamepadInputAdapter:
             joystick_module.init()
             self._owns_joystick_init = True
 
+        self._bind_event_handlers(pygame_module)
         self._refresh_joysticks()
 
+    def _bind_event_handlers(self, pygame_module: Any) -> None:
+        # pygame's event type constants are fixed once the module is loaded, so
+        # the poll loop dispatches through a table built here.
+        handlers: dict[Any, Callable[[Any], None]] = {}
+        for constant_name, handler in (
+            ("JOYBUTTONDOWN", self._on_button_down),
+            ("JOYBUTTONUP", self._on_button_up),
+            ("JOYAXISMOTION", self._on_axis_motion),
+            ("JOYDEVICEADDED", self._on_device_change),
+            ("JOYDEVICEREMOVED", self._on_device_change),
+        ):
+            event_type = getattr(pygame_module, constant_name, None)
+            if event_type is not None:
+                handlers.setdefault(event_type, handler)
+        self._event_handlers = handlers
+        self._event_get = pygame_module.event.get
+        event_wait = getattr(pygame_module.event, "wait", None)
+        self._event_wait = event_wait if callable(event_wait) else None
+        self._no_event_type = getattr(pygame_module, "NOEVENT", 0)
+        self._wake_event_type = getattr(pygame_module, "USEREVENT", None)
+        # Keep SDL from queueing mouse motion, window and other events that the
+        # poll loop would only fetch and discard.
+        if handlers:
+            allowed_types = tuple(handlers)
+            if self._wake_event_type is not None:
+                allowed_types += (self._wake_event_type,)
+            self._filters_event_queue = _set_pygame_event_filter(
+                pygame_module.event, allowed_types
+            )
+
     def _resolve_pygame_module(self) -> Any:
         if self._pygame_module is None:
             self._pygame_module = _resolve_pygame_module()
         return self._pygame_module
 
     def _run_loop(self) -> None:
-        while not self._stop_event.is_set():
+        _raise_current_thread_priority()
+        idle_polls = 0
+        while not self._stop_requested:
             try:
-                self._poll_once()
+                polled = self._poll_once()
             except Exception as exc:
                 _handle_adapter_exception(exc, self._error_callback)
-            if self._stop_event.wait(self._poll_interval_seconds):
-                break
-
-    def _poll_once(self) -> None:
-        pygame_module = self._resolve_pygame_module()
-        events = tuple(pygame_module.event.get())
-        joy_button_down = getattr(pygame_module, "JOYBUTTONDOWN", None)
-        joy_button_up = getattr(pygame_module, "JOYBUTTONUP", None)
-        joy_axis_motion = getattr(pygame_module, "JOYAXISMOTION", None)
-        joy_device_added = getattr(pygame_module, "JOYDEVICEADDED", None)
-        joy_device_removed = getattr(pygame_module, "JOYDEVICEREMOVED", None)
-        for event in events:
-            event_type = getattr(event, "type", None)
-
-            if event_type == joy_button_down:
-                self._emit_normalized(getattr(event, "button", None), pressed=True)
+                polled = 0
+            # Keep draining while events arrive; only an empty poll sleeps, so
+            # a burst is not held back a full interval per batch.
+            if polled:
+                idle_polls = 0
                 continue
-
-            if event_type == joy_button_up:
-                self._emit_normalized(getattr(event, "button", None), pressed=False)
+            if self._event_wait is not None:
+                try:
+                    self._wait_for_event()
+                except Exception as exc:
+                    _handle_adapter_exception(exc, self._error_callback)
+                    if self._wait_for_stop(self._idle_poll_interval_seconds):
+                        break
                 continue
+            interval = min(
+                self._idle_poll_interval_seconds,
+                self._poll_interval_seconds
+                * (1 << min(idle_polls, _GAMEPAD_MAX_IDLE_BACKOFF_SHIFT)),
+            )
+            idle_polls += 1
+            if self._wait_for_stop(interval):
+                break
 
-            if event_type == joy_axis_motion:
-                self._handle_axis_motion(
-                    getattr(event, "axis", None),
-                    getattr(event, "value", None),
-                )
-                continue
+    def _signal_stop(self) -> None:
+        self._stop_requested = True
+        if self._stop_lock.locked():
+            with contextlib.suppress(RuntimeError):
+                self._stop_lock.release()
+        self._wake_event_wait()
+
+    def _wake_event_wait(self) -> None:
+        # Post a no-op event so a loop blocked in event.wait returns at once
+        # rather than at the end of its timeout.
+        wake_type = self._wake_event_type
+        if self._event_wait is None or wake_type is None:
+            return
+        event_module = getattr(self._pygame_module, "event", None)
+        post = getattr(event_module, "post", None)
+        event_class = getattr(event_module, "Event", None)
+        if callable(post) and callable(event_class):
+            with contextlib.suppress(Exception):
+                post(event_class(wake_type))
+
+    def _wait_for_stop(self, timeout: float) -> bool:
+        if not self._stop_lock.acquire(timeout=timeout):
+            return False
+        self._stop_lock.release()
+        return True
+
+    def _wait_for_event(self) -> None:
+        # Sleeps in SDL until input arrives, so a press is handled as soon as it
+        # is queued rather than on the next poll tick; the poll that follows
+        # drains anything queued behind it.
+        event = self._event_wait(_GAMEPAD_EVENT_WAIT_TIMEOUT_MS)
+        if getattr(event, "type", self._no_event_type) != self._no_event_type:
+            self._handle_event(event)
+
+    def _handle_event(self, event: Any) -> None:
+        handler = self._event_handlers.get(getattr(event, "type", None))
+        if handler is not None:
+            handler(event)
+
+    def _poll_once(self) -> int:
+        event_get = self._event_get
+        if event_get is None:
+            self._bind_event_handlers(self._resolve_pygame_module())
+            event_get = self._event_get
+        # pygame hands back a fresh list each call, so it is iterated as-is.
+        events = event_get()
+        handlers = self._event_handlers
+        for event in events:
+            handler = handlers.get(getattr(event, "type", None))
+            if handler is not None:
+                handler(event)
+        return len(events)
+
+    def _on_button_down(self, event: Any) -> None:
+        self._emit_normalized(getattr(event, "button", None), pressed=True)
+
+    def _on_button_up(self, event: Any) -> None:
+        self._emit_normalized(getattr(event, "button", None), pressed=False)
+
+    def _on_axis_motion(self, event: Any) -> None:
+        self._handle_axis_motion(
+            getattr(event, "axis", None),
+            getattr(event, "value", None),
+            getattr(event, "instance_id", None),
+        )
 
-            if event_type in {joy_device_added, joy_device_removed}:
-                self._refresh_joysticks()
+    def _on_device_change(self, _event: Any) -> None:
+        self._refresh_joysticks()
 
     def _emit_normalized(self, raw_code: Any, *, pressed: bool) -> None:
-        callback = self._event_callback
-        if callback is None or raw_code is None:
+        if raw_code is None:
             return
         try:
-            callback(self._event_factory(raw_code, pressed=pressed))
+            event = self._event_factory(raw_code, pressed=pressed)
+            if event is not None:
+                self._event_callback(event)
         except ValueError:
+            # Custom factories may still reject unsupported codes by raising.
             return
         except Exception as exc:
             _handle_adapter_exception(exc, self._error_callback)
 
-    def _handle_axis_motion(self, axis: Any, value: Any) -> None:
+    def _handle_axis_motion(
+        self, axis: Any, value: Any, joystick_id: Any = None
+    ) -> None:
+        # Stick axes stream motion constantly, so reject non-trigger axes before
+        # paying for the value coercion.
+        if type(axis) is int:
+            axis_index = axis
+        else:
+            try:
+                axis_index = int(axis)
+            except (TypeError, ValueError):
+                return
+
+        if not 0 <= axis_index < len(_GAMEPAD_TRIGGER_AXIS_TO_BUTTON):
+            return
+        virtual_button = _GAMEPAD_TRIGGER_AXIS_TO_BUTTON[axis_index]
+        if virtual_button < 0:
+            return
+
         try:
-            axis_index = int(axis)
             axis_value = float(value)
         except (TypeError, ValueError):
             return
 
-        virtual_button = _GAMEPAD_TRIGGER_AXIS_TO_BUTTON.get(axis_index)
-        if virtual_button is None:
-            return
-
-        is_pressed = self._axis_button_states.get(virtual_button, False)
-        if not is_pressed and axis_value >= _GAMEPAD_TRIGGER_PRESS_THRESHOLD:
-            self._axis_button_states[virtual_button] = True
-            self._emit_normalized(virtual_button, pressed=True)
-            return
+        trigger_states = self._axis_button_states.get(joystick_id)
+        if trigger_states is None:
+            trigger_states = bytearray(_GAMEPAD_TRIGGER_STATE_SIZE)
+            self._axis_button_states[joystick_id] = trigger_states
 
-        if is_pressed and axis_value <= _GAMEPAD_TRIGGER_RELEASE_THRESHOLD:
-            self._axis_button_states[virtual_button] = False
-            self._emit_normalized(virtual_button, pressed=False)
+        was_pressed = trigger_states[virtual_button]
+        # Hysteresis: a held trigger stays held until it drops to the release
+        # threshold, written so a NaN reading never changes state.
+        if was_pressed:
+            is_pressed = not axis_value <= _GAMEPAD_TRIGGER_RELEASE_THRESHOLD
+        else:
+            is_pressed = axis_value >= _GAMEPAD_TRIGGER_PRESS_THRESHOLD
+        if is_pressed != was_pressed:
+            trigger_states[virtual_button] = is_pressed
+            self._emit_normalized(virtual_button, pressed=is_pressed)
 
     def _refresh_joysticks(self) -> None:
         pygame_module = self._resolve_pygame_module()
@@ -506,32 +811,33 @@ class GamepadInputAdapter:
         count = max(0, int(joystick_module.get_count()))
 
         while len(self._joysticks) > count:
-            joystick = self._joysticks.pop()
-            quit_fn = getattr(joystick, "quit", None)
-            if callable(quit_fn):
-                quit_fn()
+            handle = self._joysticks.pop()
+            if handle.quit is not None:
+                handle.quit()
 
         for index in range(len(self._joysticks), count):
-            joystick = joystick_module.Joystick(index)
-            init_fn = getattr(joystick, "init", None)
-            if callable(init_fn):
-                init_fn()
-            self._joysticks.append(joystick)
+            self._joysticks.append(_open_joystick_handle(joystick_module, index))
 
     def _cleanup_runtime(self) -> None:
         pygame_module = self._pygame_module
         if pygame_module is None:
             return
 
-        for joystick in reversed(self._joysticks):
-            quit_fn = getattr(joystick, "quit", None)
-            if callable(quit_fn):
+        for handle in reversed(self._joysticks):
+            if handle.quit is not None:
                 try:
-                    quit_fn()
+                    handle.quit()
                 except Exception:
                     pass
         self._joysticks.clear()
 
+        if self._filters_event_queue:
+            self._filters_event_queue = False
+            try:
+                _set_pygame_event_filter(pygame_module.event, None)
+            except Exception:
+                pass
+
         joystick_module = None
         if hasattr(pygame_module, "joystick"):
             joystick_module = pygame_module.joystick
@@ -557,7 +863,14 @@ class GamepadInputAdapter:
 
 
 class InputRouter:
-    """Unified lifecycle controller that routes global input into tracker logic."""
+    """
+    Unified lifecycle controller that routes global input into tracker logic.
+
+    By default events are handed to a worker thread so slow handlers never stall
+    the pynput listener threads. With ``direct_dispatch=True`` the adapter
+    thread dispatches inline instead, serialized by a lock; use it only when
+    the tracker engine and callbacks are cheap and thread-agnostic.
+    """
 
     def __init__(
         self,
@@ -567,25 +880,37 @@ class InputRouter:
         on_event: Callable[[InputEvent], None] | None = None,
         on_triggered: Callable[[InputEvent, list[SkillItem]], None] | None = None,
         on_error: Callable[[Exception], None] | None = None,
+        direct_dispatch: bool = False,
+        event_buffer_capacity: int = _EVENT_BUFFER_CAPACITY,
     ) -> None:
         self._tracker_engine = tracker_engine or TrackerInputEngine()
+        self._direct_dispatch = direct_dispatch
+        self._dispatch_lock = threading.Lock()
         self._on_event = on_event
         self._on_triggered = on_triggered
         self._on_error = on_error
 
-        self._adapters: list[InputAdapter] = (
-            list(adapters)
+        # Fixed for the router's lifetime, so the adapters property can hand out
+        # the tuple itself.
+        self._adapters: tuple[InputAdapter, ...] = (
+            tuple(adapters)
             if adapters is not None
-            else [
+            else (
                 KeyboardInputAdapter(error_callback=on_error),
                 MouseInputAdapter(error_callback=on_error),
                 GamepadInputAdapter(error_callback=on_error),
-            ]
+            )
         )
         for adapter in self._adapters:
             adapter.set_event_callback(self.route_input_event)
 
-        self._event_queue: Queue[InputEvent | None] = Queue()
+        # deque.append/popleft are atomic, so the adapter threads can feed the
+        # worker without a lock; the wakeup event is only set on a transition.
+        # When full, the oldest pending events are dropped.
+        self._event_buffer: deque[InputEvent] = deque(
+            maxlen=max(1, int(event_buffer_capacity))
+        )
+        self._worker_wakeup = threading.Event()
         self._worker_stop_event = threading.Event()
         self._worker_thread: threading.Thread | None = None
         self._is_running = False
@@ -598,26 +923,32 @@ class InputRouter:
 
     @property
     def adapters(self) -> tuple[InputAdapter, ...]:
-        return tuple(self._adapters)
+        return self._adapters
 
     def set_skill_items(self, skill_items: Sequence[SkillItem]) -> None:
         self._tracker_engine.set_skill_items(skill_items)
+        virtual_keys = _win32_virtual_keys_for(skill_items)
+        for adapter in self._adapters:
+            set_key_filter = getattr(adapter, "set_key_filter", None)
+            if callable(set_key_filter):
+                set_key_filter(virtual_keys)
 
     def start(self) -> None:
         with self._state_lock:
             if self._is_running:
                 return
 
-            self._drain_queue()
+            self._event_buffer.clear()
             self._worker_stop_event.clear()
             self._accepting_events = True
             self._is_running = True
-            self._worker_thread = threading.Thread(
-                target=self._run_worker,
-                name="d2rso-input-router",
-                daemon=True,
-            )
-            self._worker_thread.start()
+            if not self._direct_dispatch:
+                self._worker_thread = threading.Thread(
+                    target=self._run_worker,
+                    name="d2rso-input-router",
+                    daemon=True,
+                )
+                self._worker_thread.start()
 
         started_adapters: list[InputAdapter] = []
         try:
@@ -654,28 +985,59 @@ class InputRouter:
             raise error
 
     def route_input_event(self, event: InputEvent) -> None:
-        if not isinstance(event, InputEvent):
+        # Adapters always hand over exact InputEvent instances, so the exact type
+        # check settles them and isinstance only runs for subclasses or errors.
+        if type(event) is not InputEvent and not isinstance(event, InputEvent):
             raise TypeError("event must be an InputEvent.")
         if not self._accepting_events:
             return
-        self._event_queue.put(event)
+        if self._direct_dispatch:
+            with self._dispatch_lock:
+                try:
+                    self._dispatch_event(event)
+                except Exception as exc:
+                    if self._on_error is not None:
+                        self._on_error(exc)
+            return
+        self._event_buffer.append(event)
+        # The worker clears the flag before draining, so a flag that is still
+        # set guarantees this event will be seen without another notify.
+        if not self._worker_wakeup.is_set():
+            self._worker_wakeup.set()
 
     def _run_worker(self) -> None:
+        _raise_current_thread_priority()
+        event_buffer = self._event_buffer
+        pop_event = event_buffer.popleft
+        wakeup = self._worker_wakeup
+        # The engine and callbacks are fixed for the router's lifetime, so the
+        # drain loop below inlines _dispatch_event with them bound as locals.
+        process_event = self._tracker_engine.process_event
+        on_event = self._on_event
+        on_triggered = self._on_triggered
+        on_error = self._on_error
         while True:
-            if self._worker_stop_event.is_set() and self._event_queue.empty():
-                return
-            try:
-                event = self._event_queue.get(timeout=_QUEUE_TIMEOUT_SECONDS)
-            except Empty:
-                continue
-            if event is None:
+            # One wakeup drains the whole backlog with no lock taken per event.
+            wakeup.clear()
+            while event_buffer:
+                event = pop_event()
+                try:
+                    triggered = process_event(event)
+                    if on_event is not None:
+                        on_event(event)
+                    if on_triggered is not None:
+                        on_triggered(event, triggered)
+                except Exception as exc:
+                    if on_error is not None:
+                        on_error(exc)
+
+            if self._worker_stop_event.is_set():
+                if not event_buffer:
+                    return
                 continue
-
-            try:
-                self._dispatch_event(event)
-            except Exception as exc:
-                if self._on_error is not None:
-                    self._on_error(exc)
+            # Every append and the shutdown path set the flag, so an idle worker
+            # can sleep until one of them happens instead of waking on a timer.
+            wakeup.wait()
 
     def _dispatch_event(self, event: InputEvent) -> list[SkillItem]:
         triggered = self._tracker_engine.process_event(event)
@@ -687,7 +1049,7 @@ class InputRouter:
 
     def _shutdown_worker(self) -> None:
         self._worker_stop_event.set()
-        self._event_queue.put(None)
+        self._worker_wakeup.set()
         worker = self._worker_thread
         self._worker_thread = None
         if worker is not None and worker.is_alive():
@@ -697,24 +1059,67 @@ class InputRouter:
             self._is_running = False
             self._accepting_events = False
 
-        self._drain_queue()
-
-    def _drain_queue(self) -> None:
-        while True:
-            try:
-                self._event_queue.get_nowait()
-            except Empty:
-                break
+        self._event_buffer.clear()
 
 
 def _default_keyboard_listener_factory(
     on_press: Callable[[Any], None],
     on_release: Callable[[Any], None],
+    *,
+    win32_event_filter: Callable[[Any, Any], bool] | None = None,
 ) -> Any:
     from pynput import keyboard
 
     _apply_darwin_pynput_keyboard_workaround(keyboard)
-    return keyboard.Listener(on_press=on_press, on_release=on_release)
+    # pynput drops platform-prefixed options on other platforms.
+    return keyboard.Listener(
+        on_press=on_press,
+        on_release=on_release,
+        win32_event_filter=win32_event_filter,
+    )
+
+
+def _physical_key_identity(raw_code: Any) -> Any:
+    """
+    Return a key that stays the same across modifiers for one physical key.
+
+    pynput key codes carry the virtual-key code alongside the typed character;
+    special keys (``Key`` members) and plain test codes are used as they are.
+    """
+    virtual_key = getattr(raw_code, "vk", None)
+    if type(virtual_key) is int:
+        return virtual_key
+    try:
+        hash(raw_code)
+    except TypeError:
+        return repr(raw_code)
+    return raw_code
+
+
+def _win32_virtual_keys_for(skill_items: Iterable[SkillItem]) -> frozenset[int] | None:
+    """
+    Return every virtual-key code that can produce the skill items' keys, or
+    None when a keyboard code has no unambiguous mapping and every key must
+    stay visible.
+    """
+    virtual_keys: set[int] = set()
+    for item in skill_items:
+        if not isinstance(item, SkillItem):
+            continue
+        for code in (item.skill_key, item.select_key):
+            if code is None:
+                continue
+            source = infer_input_source_from_code(code)
+            if source is not None and source is not InputSource.KEYBOARD:
+                continue
+            normalized = normalize_keyboard_code(code)
+            if normalized is None:
+                continue
+            code_virtual_keys = _WIN32_VIRTUAL_KEY_CODES.get(normalized)
+            if code_virtual_keys is None:
+                return None
+            virtual_keys.update(code_virtual_keys)
+    return frozenset(virtual_keys)
 
 
 def _default_mouse_listener_factory(
@@ -725,6 +1130,10 @@ def _default_mouse_listener_factory(
     return mouse.Listener(on_click=on_click)
 
 
+def _ignore_event(_event: InputEvent) -> None:
+    """Stand-in event callback so adapters never test for a missing one."""
+
+
 def _handle_adapter_exception(
     exception: Exception,
     callback: Callable[[Exception], None] | None,
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import os
+import stat
 import sys
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from types import MappingProxyType
 from typing import Mapping
@@ -28,7 +31,11 @@ _KEYS_SPEC = (
 
 _DEFAULT_ASSETS_DIR = Path("assets") / "skills"
 _ASSETS_DIR_ENV_VAR = "D2RSO_ASSETS_DIR"
+# Resolved once: Path.resolve() walks the path with a stat call per component.
+_SOURCE_ASSETS_DIR = Path(__file__).resolve().parents[2] / _DEFAULT_ASSETS_DIR
 _IMAGE_EXTENSIONS = {".bmp", ".gif", ".ico", ".jpeg", ".jpg", ".png", ".webp"}
+_ICON_BYTES_CACHE_SIZE = 64
+_GET_ICON_CACHE_SIZE = 256
 
 
 def _default_assets_dir() -> Path:
@@ -42,14 +49,14 @@ def _default_assets_dir() -> Path:
         if bundled_assets_dir.exists():
             return bundled_assets_dir
 
-    source_assets_dir = Path(__file__).resolve().parents[2] / _DEFAULT_ASSETS_DIR
-    if source_assets_dir.exists():
-        return source_assets_dir
+    if _SOURCE_ASSETS_DIR.exists():
+        return _SOURCE_ASSETS_DIR
 
     return Path.cwd() / _DEFAULT_ASSETS_DIR
 
 
 def _normalize_lookup(value: str) -> str:
+    # A single-character str.replace is far cheaper than str.translate here.
     return value.replace("\\", "/").strip().lower()
 
 
@@ -65,6 +72,32 @@ def _can_read_image_file(path: Path) -> bool:
     return reader.canRead()
 
 
+@lru_cache(maxsize=256)
+def _can_read_image_file_version(path: Path, mtime_ns: int, size: int) -> bool:
+    # Keyed on the file's mtime and size, so reloads only sniff new or changed
+    # files with Qt.
+    return _can_read_image_file(path)
+
+
+@lru_cache(maxsize=_ICON_BYTES_CACHE_SIZE)
+def _load_icon_bytes(path: Path, mtime_ns: int, size: int) -> bytes:
+    # Keyed on the file's mtime and size so a replaced file is read again. A
+    # failed read raises, and lru_cache does not cache exceptions.
+    return path.read_bytes()
+
+
+def _read_icon_bytes(asset: IconAsset) -> bytes | None:
+    try:
+        return _load_icon_bytes(asset.path, asset.mtime_ns, asset.size)
+    except OSError:
+        return None
+
+
+def _is_direct_path_ref(icon_ref: str | Path) -> bool:
+    path = Path(icon_ref)
+    return path.is_absolute() or len(path.parts) > 1
+
+
 def _parse_key_entries(spec: str) -> tuple["KeyEntry", ...]:
     result: list[KeyEntry] = []
     for raw_item in spec.split(","):
@@ -93,13 +126,35 @@ class KeyEntry:
         return self.code or ""
 
 
+# The key catalog is fixed, so it is parsed once and shared by every registry.
+_AVAILABLE_KEYS = _parse_key_entries(_KEYS_SPEC)
+_NULL_KEY = next((entry for entry in _AVAILABLE_KEYS if entry.code is None), None)
+_KEYS_BY_CODE: Mapping[str, KeyEntry] = MappingProxyType(
+    {
+        _normalize_lookup(entry.code): entry
+        for entry in _AVAILABLE_KEYS
+        if entry.code is not None
+    }
+)
+# Saved settings hold catalog codes verbatim, so most lookups hit this exact
+# index and skip normalization.
+_KEYS_BY_EXACT_CODE: Mapping[str, KeyEntry] = MappingProxyType(
+    {entry.code: entry for entry in _AVAILABLE_KEYS if entry.code is not None}
+)
+
+
 @dataclass(frozen=True, slots=True)
 class IconAsset:
-    """Loaded icon metadata and bytes."""
+    """Icon metadata; the file bytes are read on first use."""
 
     key: str
     path: Path
-    data: bytes
+    size: int
+    mtime_ns: int
+
+    @property
+    def data(self) -> bytes:
+        return _read_icon_bytes(self) or b""
 
 
 class KeyIconRegistry:
@@ -111,18 +166,17 @@ class KeyIconRegistry:
         else:
             self.assets_dir = Path(assets_dir)
 
-        self._available_keys = _parse_key_entries(_KEYS_SPEC)
-        self._null_key = next(
-            (entry for entry in self._available_keys if entry.code is None), None
-        )
-        self._keys_by_code = {
-            _normalize_lookup(entry.code): entry
-            for entry in self._available_keys
-            if entry.code is not None
-        }
+        self._available_keys = _AVAILABLE_KEYS
+        self._null_key = _NULL_KEY
+        self._keys_by_code = _KEYS_BY_CODE
 
         self._icons_by_key: dict[str, IconAsset] = {}
         self._icons_by_lookup: dict[str, IconAsset] = {}
+        # Most recent get_icon results keyed by the raw reference, so repeated
+        # paints skip normalization and filesystem probes. Misses are kept only
+        # for bare file names, which resolve against the asset index; a path
+        # reference may appear on disk later. Cleared by reload_icons.
+        self._get_icon_cache: OrderedDict[str | Path, IconAsset | None] = OrderedDict()
         self.reload_icons()
 
     @property
@@ -141,6 +195,9 @@ class KeyIconRegistry:
     def get_key(self, code: str | None) -> KeyEntry | None:
         if code is None:
             return self._null_key
+        entry = _KEYS_BY_EXACT_CODE.get(code)
+        if entry is not None:
+            return entry
         normalized = _normalize_lookup(code)
         if not normalized:
             return self._null_key
@@ -157,6 +214,7 @@ class KeyIconRegistry:
     def reload_icons(self) -> None:
         self._icons_by_key.clear()
         self._icons_by_lookup.clear()
+        self._get_icon_cache.clear()
 
         if not self.assets_dir.exists() or not self.assets_dir.is_dir():
             return
@@ -165,19 +223,22 @@ class KeyIconRegistry:
             self.assets_dir.iterdir(),
             key=lambda item: item.name.lower(),
         ):
-            if not path.is_file() or path.suffix.lower() not in _IMAGE_EXTENSIONS:
-                continue
-            if not _can_read_image_file(path):
+            if path.suffix.lower() not in _IMAGE_EXTENSIONS:
                 continue
-
             try:
-                raw = path.read_bytes()
+                file_stat = path.stat()
             except OSError:
                 continue
+            if not stat.S_ISREG(file_stat.st_mode):
+                continue
+            size = file_stat.st_size
+            mtime_ns = file_stat.st_mtime_ns
+            if not _can_read_image_file_version(path, mtime_ns, size):
+                continue
 
             resolved_path = path.resolve()
             key = _normalize_lookup(str(resolved_path))
-            asset = IconAsset(key=key, path=resolved_path, data=raw)
+            asset = IconAsset(key=key, path=resolved_path, size=size, mtime_ns=mtime_ns)
             self._icons_by_key[key] = asset
 
             self._icons_by_lookup[key] = asset
@@ -189,7 +250,26 @@ class KeyIconRegistry:
         if icon_ref is None:
             return None
 
-        candidate = _normalize_lookup(str(icon_ref))
+        cache = self._get_icon_cache
+        try:
+            icon = cache[icon_ref]
+        except KeyError:
+            pass
+        else:
+            cache.move_to_end(icon_ref)
+            return icon
+        icon = self._find_icon(icon_ref)
+        if icon is None and _is_direct_path_ref(icon_ref):
+            return None
+        cache[icon_ref] = icon
+        if len(cache) > _GET_ICON_CACHE_SIZE:
+            cache.popitem(last=False)
+        return icon
+
+    def _find_icon(self, icon_ref: str | Path) -> IconAsset | None:
+        candidate = _normalize_lookup(
+            icon_ref if type(icon_ref) is str else str(icon_ref)
+        )
         if not candidate:
             return None
 
@@ -201,14 +281,15 @@ class KeyIconRegistry:
             if not _can_read_image_file(possible_path):
                 return None
             try:
-                raw = possible_path.read_bytes()
+                file_stat = possible_path.stat()
             except OSError:
                 return None
             resolved = possible_path.resolve()
             return IconAsset(
                 key=_normalize_lookup(str(resolved)),
                 path=resolved,
-                data=raw,
+                size=file_stat.st_size,
+                mtime_ns=file_stat.st_mtime_ns,
             )
 
         file_name_candidate = _normalize_lookup(Path(candidate).name)
@@ -223,7 +304,9 @@ class KeyIconRegistry:
 
     def get_icon_bytes(self, icon_ref: str | Path | None) -> bytes | None:
         icon = self.get_icon(icon_ref)
-        return icon.data if icon is not None else None
+        if icon is None:
+            return None
+        return _read_icon_bytes(icon)
 
 
 _default_registry: KeyIconRegistry | None = None
@@ -4,12 +4,33 @@ from __future__ import annotations
 
 import os
 import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from PySide6 import QtCore, QtWidgets
+if TYPE_CHECKING:
+    from PySide6 import QtWidgets
 
-from .main_window import MainWindow
+    from .main_window import MainWindow
 
 _AUTO_EXIT_MS_ENV_VAR = "D2RSO_AUTO_EXIT_MS"
+_DISPLAY_ENV_VARS = ("DISPLAY", "WAYLAND_DISPLAY", "QT_QPA_PLATFORM")
+# Qt and the window module load on first use, so importing this module (for
+# packaging checks, the auto-exit helpers or tests) stays cheap.
+_LAZY_MODULES: dict[str, str] = {
+    "QtCore": "PySide6.QtCore",
+    "QtWidgets": "PySide6.QtWidgets",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_MODULES[name]
+    except KeyError as exc:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+
+    module = import_module(module_name)
+    globals()[name] = module
+    return module
 
 
 def _get_auto_exit_delay_ms() -> int | None:
@@ -28,8 +49,21 @@ def _get_auto_exit_delay_ms() -> int | None:
     return delay_ms
 
 
+def _can_display() -> bool:
+    """Return whether Qt has a display to open windows on.
+
+    Windows and macOS always provide one to desktop sessions; other POSIX
+    systems need an X11/Wayland display or an explicit Qt platform plugin.
+    """
+    if sys.platform.startswith("win") or sys.platform == "darwin":
+        return True
+    return any(os.environ.get(name) for name in _DISPLAY_ENV_VARS)
+
+
 def build_window() -> MainWindow:
     """Create the application window."""
+    from .main_window import MainWindow
+
     return MainWindow()
 
 
@@ -38,15 +72,26 @@ def _request_auto_exit(
     window: MainWindow,
 ) -> None:
     """Terminate the app reliably for automation and smoke tests."""
+    from PySide6 import QtCore
+
     window.exit_to_desktop()
     QtCore.QTimer.singleShot(0, app.quit)
 
 
 def run() -> None:
     """Launch the desktop UI."""
+    from PySide6 import QtCore, QtWidgets
+
     app = QtWidgets.QApplication.instance()
     owns_app = app is None
     if app is None:
+        # Fail before QApplication spends time on platform plugin setup only
+        # to abort the process on a headless session.
+        if not _can_display():
+            raise RuntimeError(
+                "No display available; set DISPLAY, WAYLAND_DISPLAY or "
+                "QT_QPA_PLATFORM to run the D2RSO UI."
+            )
         app = QtWidgets.QApplication(sys.argv)
 
     window = build_window()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -30,6 +31,7 @@ _COL_DURATION = 2
 _COL_SELECT = 3
 _COL_USE = 4
 _COL_REMOVE = 5
+_SKILL_ROW_HEIGHT_PX = 46
 _DISABLE_TRAY_ENV_VAR = "D2RSO_DISABLE_TRAY"
 
 
@@ -68,6 +70,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self._settings.ensure_defaults()
 
         self._icon_registry = icon_registry or get_key_icon_registry()
+        # One QIcon per icon file, shared by every row's icon combo so each
+        # file is decoded once instead of once per row.
+        self._combo_icons: dict[Path, QtGui.QIcon] = {}
         self._options_dialog: OptionsDialog | None = None
         self._preview_overlay: CooldownOverlayWindow | None = None
         self._runtime_overlay: CooldownOverlayWindow | None = None
@@ -431,7 +436,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.skill_table.setHorizontalHeaderLabels(
             ["Enabled", "Icon", "Duration (sec)", "Select Key", "Skill Key", ""]
         )
-        self.skill_table.verticalHeader().setVisible(False)
+        row_header = self.skill_table.verticalHeader()
+        row_header.setVisible(False)
+        # Every row has the same fixed height, declared once for the header
+        # rather than applied (and re-laid out) per inserted row.
+        row_header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        row_header.setDefaultSectionSize(_SKILL_ROW_HEIGHT_PX)
         self.skill_table.setAlternatingRowColors(True)
         self.skill_table.setSelectionMode(
             QtWidgets.QAbstractItemView.SelectionMode.NoSelection
@@ -514,16 +524,21 @@ class MainWindow(QtWidgets.QMainWindow):
         selected_items = [
             item for item in self._settings.skill_items if item.profile_id == profile.id
         ]
-        for item in selected_items:
-            self._append_skill_row(item)
+        # Size the table once so the model emits a single rows-inserted batch
+        # instead of one per skill, and hold repaints until every row's cell
+        # widgets are in place so the viewport lays out and paints once.
+        self.skill_table.setUpdatesEnabled(False)
+        try:
+            self.skill_table.setRowCount(len(selected_items))
+            for row_index, item in enumerate(selected_items):
+                self._fill_skill_row(row_index, item)
+        finally:
+            self.skill_table.setUpdatesEnabled(True)
 
         self._refresh_preview_skills()
         self._update_control_states()
 
-    def _append_skill_row(self, item: SkillItem) -> None:
-        row_index = self.skill_table.rowCount()
-        self.skill_table.insertRow(row_index)
-
+    def _fill_skill_row(self, row_index: int, item: SkillItem) -> None:
         enabled_checkbox = QtWidgets.QCheckBox(self)
         enabled_checkbox.setChecked(item.is_enabled)
         enabled_checkbox.toggled.connect(
@@ -587,8 +602,6 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         self.skill_table.setCellWidget(row_index, _COL_REMOVE, remove_button)
 
-        self.skill_table.setRowHeight(row_index, 46)
-
     def _build_icon_combo(self, item: SkillItem) -> QtWidgets.QComboBox:
         combo = QtWidgets.QComboBox(self)
         combo.setIconSize(QtCore.QSize(32, 32))
@@ -596,7 +609,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         for icon in self._icon_registry.list_icons():
             combo.addItem(
-                QtGui.QIcon(str(icon.path)),
+                self._combo_icon(icon.path),
                 icon.path.name,
                 icon.path.name,
             )
@@ -611,6 +624,13 @@ class MainWindow(QtWidgets.QMainWindow):
         combo.setCurrentIndex(selected_index if selected_index >= 0 else 0)
         return combo
 
+    def _combo_icon(self, path: Path) -> QtGui.QIcon:
+        icon = self._combo_icons.get(path)
+        if icon is None:
+            icon = QtGui.QIcon(str(path))
+            self._combo_icons[path] = icon
+        return icon
+
     def _build_key_combo(self, current_code: str | None) -> QtWidgets.QComboBox:
         combo = QtWidgets.QComboBox(self)
         for entry in self._list_key_entries_for_combo(current_code):
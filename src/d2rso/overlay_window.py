@@ -5,9 +5,10 @@ from __future__ import annotations
 import ctypes
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from math import ceil
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, Sequence
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
@@ -27,6 +28,18 @@ _SWP_NOZORDER = 0x0004
 _SWP_NOACTIVATE = 0x0010
 _SWP_FRAMECHANGED = 0x0020
 _DISPLAY_ROUNDING_EPSILON = 1e-6
+_PLACEHOLDER_FILL_COLOR = QtGui.QColor(24, 24, 24, 220)
+_PLACEHOLDER_BORDER_COLOR = QtGui.QColor(240, 240, 240, 170)
+_PLACEHOLDER_TEXT_COLOR = QtGui.QColor(255, 255, 255)
+
+
+@lru_cache(maxsize=1)
+def _placeholder_label_font() -> QtGui.QFont:
+    # Built on first use, once a QApplication exists, then shared by every card.
+    font = QtGui.QFont()
+    font.setPointSize(9)
+    font.setBold(True)
+    return font
 
 
 def format_remaining_seconds(remaining_seconds: float) -> str:
@@ -50,7 +63,7 @@ class OverlayTrackerSnapshot:
 
 
 class _CountdownEventBridge(QtCore.QObject):
-    event_received = QtCore.Signal(object)
+    events_received = QtCore.Signal(object)
 
 
 def _is_windows_platform() -> bool:
@@ -133,7 +146,7 @@ class _OverlayTrackerItemWidget(QtWidgets.QFrame):
         self.skill_id = int(skill_id)
         self._icon_size = icon_size
         self._remaining_seconds = 0.0
-        self._is_warning: bool | None = None
+        self._is_warning = False
 
         self.setObjectName("overlay_item_frame")
         self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground, True)
@@ -156,8 +169,11 @@ class _OverlayTrackerItemWidget(QtWidgets.QFrame):
 
         self.set_digits_visible(show_digits)
         self.set_remaining_seconds(0.0)
-        self._set_icon_pixmap(None)
-        self.set_warning_state(False)
+        self._show_placeholder_pixmap()
+        # Not polished yet, so the stylesheet picks these up on first show;
+        # re-polishing here would resolve the style rules twice per card.
+        self.setProperty("warning", False)
+        self._digits_label.setProperty("warning", False)
 
     @property
     def remaining_seconds(self) -> float:
@@ -191,21 +207,47 @@ class _OverlayTrackerItemWidget(QtWidgets.QFrame):
         self._set_warning_property(self._digits_label, normalized)
 
     def set_icon_path(self, icon_path: Path | None) -> None:
-        if icon_path is not None and icon_path.exists():
-            pixmap = QtGui.QPixmap(str(icon_path))
-            if not pixmap.isNull():
-                self._set_icon_pixmap(pixmap)
-                return
-        self._set_icon_pixmap(None)
-
-    def _set_icon_pixmap(self, pixmap: QtGui.QPixmap | None) -> None:
-        source = pixmap if pixmap is not None else self._build_placeholder_pixmap()
-        scaled = source.scaled(
-            self._icon_size,
-            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-            QtCore.Qt.TransformationMode.SmoothTransformation,
+        if icon_path is not None:
+            try:
+                modified_ns = icon_path.stat().st_mtime_ns
+            except OSError:
+                modified_ns = None
+            if modified_ns is not None:
+                scaled = self._cached_scaled_pixmap(
+                    f"icon:{modified_ns}:{icon_path}",
+                    lambda: QtGui.QPixmap(str(icon_path)),
+                )
+                if scaled is not None:
+                    self._icon_label.setPixmap(scaled)
+                    return
+        self._show_placeholder_pixmap()
+
+    def _show_placeholder_pixmap(self) -> None:
+        scaled = self._cached_scaled_pixmap(
+            f"placeholder:{self.skill_id}", self._build_placeholder_pixmap
         )
-        self._icon_label.setPixmap(scaled)
+        self._icon_label.setPixmap(scaled if scaled is not None else QtGui.QPixmap())
+
+    def _cached_scaled_pixmap(
+        self, key: str, build: Callable[[], QtGui.QPixmap]
+    ) -> QtGui.QPixmap | None:
+        # A card is created each time a cooldown starts, so the decoded and
+        # scaled icon is kept in Qt's pixmap cache instead of being re-read
+        # from disk and re-rendered per card.
+        size = self._icon_size
+        cache_key = f"d2rso-overlay:{size.width()}x{size.height()}:{key}"
+        scaled = QtGui.QPixmapCache.find(cache_key)
+        if scaled is None:
+            source = build()
+            if source.isNull():
+                return None
+            scaled = source.scaled(
+                size,
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.SmoothTransformation,
+            )
+            QtGui.QPixmapCache.insert(cache_key, scaled)
+        return scaled
 
     @staticmethod
     def _set_warning_property(widget: QtWidgets.QWidget, is_warning: bool) -> None:
@@ -224,15 +266,12 @@ class _OverlayTrackerItemWidget(QtWidgets.QFrame):
         try:
             painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
             rect = pixmap.rect().adjusted(2, 2, -2, -2)
-            painter.setBrush(QtGui.QColor(24, 24, 24, 220))
-            painter.setPen(QtGui.QPen(QtGui.QColor(240, 240, 240, 170), 1))
+            painter.setBrush(_PLACEHOLDER_FILL_COLOR)
+            painter.setPen(QtGui.QPen(_PLACEHOLDER_BORDER_COLOR, 1))
             painter.drawRoundedRect(rect, 8, 8)
 
-            painter.setPen(QtGui.QColor(255, 255, 255))
-            font = QtGui.QFont()
-            font.setPointSize(9)
-            font.setBold(True)
-            painter.setFont(font)
+            painter.setPen(_PLACEHOLDER_TEXT_COLOR)
+            painter.setFont(_placeholder_label_font())
             painter.drawText(
                 rect,
                 QtCore.Qt.AlignmentFlag.AlignCenter,
@@ -271,8 +310,8 @@ class CooldownOverlayWindow(QtWidgets.QWidget):
         self._insert_left_mode = bool(self._settings.is_tracker_insert_to_left)
 
         self._event_bridge = _CountdownEventBridge(self)
-        self._event_bridge.event_received.connect(
-            self._handle_countdown_event,
+        self._event_bridge.events_received.connect(
+            self._handle_countdown_events,
             QtCore.Qt.ConnectionType.QueuedConnection,
         )
 
@@ -365,11 +404,11 @@ class CooldownOverlayWindow(QtWidgets.QWidget):
         self.unbind_countdown_service()
 
         self._countdown_service = countdown_service
-        self._countdown_service.subscribe(self._queue_countdown_event)
+        self._countdown_service.subscribe_batch(self._queue_countdown_events)
         self._poll_timer.start()
 
-        for state in self._countdown_service.list_active():
-            self._handle_countdown_event(
+        self._handle_countdown_events(
+            tuple(
                 CountdownEvent(
                     type=CountdownEventType.UPDATED,
                     skill_id=state.skill_id,
@@ -377,12 +416,14 @@ class CooldownOverlayWindow(QtWidgets.QWidget):
                     remaining_seconds=state.remaining_seconds,
                     completed=False,
                 )
+                for state in self._countdown_service.list_active()
             )
+        )
 
     def unbind_countdown_service(self) -> None:
         """Detach from the active countdown service."""
         if self._countdown_service is not None:
-            self._countdown_service.unsubscribe(self._queue_countdown_event)
+            self._countdown_service.unsubscribe_batch(self._queue_countdown_events)
             self._countdown_service = None
         self._poll_timer.stop()
 
@@ -521,36 +562,59 @@ class CooldownOverlayWindow(QtWidgets.QWidget):
             return QtWidgets.QBoxLayout.Direction.TopToBottom
         return QtWidgets.QBoxLayout.Direction.LeftToRight
 
-    def _queue_countdown_event(self, event: CountdownEvent) -> None:
-        self._event_bridge.event_received.emit(event)
+    def _queue_countdown_events(self, events: Sequence[CountdownEvent]) -> None:
+        self._event_bridge.events_received.emit(events)
 
     def _poll_countdowns(self) -> None:
         if self._preview_mode or self._countdown_service is None:
             return
         self._countdown_service.emit_updates()
+        # Nothing left to count down: stop ticking until a refresh event
+        # restarts the timer, so an idle overlay costs no wakeups.
+        if self._countdown_service.active_count == 0:
+            self._poll_timer.stop()
 
     @QtCore.Slot(object)
-    def _handle_countdown_event(self, event: object) -> None:
+    def _handle_countdown_events(self, events: object) -> None:
         if self._preview_mode:
             return
-        if not isinstance(event, CountdownEvent):
+        if not isinstance(events, Sequence):
             return
 
-        if event.type is CountdownEventType.REMOVED:
-            self._remove_tracker_widget(event.skill_id)
-            return
+        changed = False
+        updated = False
+        for event in events:
+            if not isinstance(event, CountdownEvent):
+                continue
 
-        if event.type is CountdownEventType.UPDATED:
-            self._upsert_tracker_widget(
-                skill_id=event.skill_id,
-                remaining_seconds=event.remaining_seconds,
-            )
+            if event.type is CountdownEventType.REMOVED:
+                self._remove_tracker_widget(event.skill_id, adjust_size=False)
+                changed = True
+            elif event.type is CountdownEventType.UPDATED:
+                self._upsert_tracker_widget(
+                    skill_id=event.skill_id,
+                    remaining_seconds=event.remaining_seconds,
+                    adjust_size=False,
+                )
+                changed = True
+                updated = True
+
+        # Resize once per batch rather than once per tracker.
+        if changed:
+            self.adjustSize()
+        if (
+            updated
+            and self._countdown_service is not None
+            and not self._poll_timer.isActive()
+        ):
+            self._poll_timer.start()
 
     def _upsert_tracker_widget(
         self,
         *,
         skill_id: int,
         remaining_seconds: float,
+        adjust_size: bool = True,
     ) -> None:
         widget = self._widgets_by_skill_id.get(skill_id)
         if widget is None:
@@ -573,19 +637,23 @@ class CooldownOverlayWindow(QtWidgets.QWidget):
         widget.set_warning_state(
             threshold_seconds > 0 and widget.remaining_seconds <= threshold_seconds
         )
-        self.adjustSize()
+        if adjust_size:
+            self.adjustSize()
 
     def _clear_tracker_widgets(self) -> None:
         for skill_id in list(self._widgets_by_skill_id):
             self._remove_tracker_widget(skill_id)
 
-    def _remove_tracker_widget(self, skill_id: int) -> None:
+    def _remove_tracker_widget(
+        self, skill_id: int, *, adjust_size: bool = True
+    ) -> None:
         widget = self._widgets_by_skill_id.pop(skill_id, None)
         if widget is None:
             return
         self._items_layout.removeWidget(widget)
         widget.deleteLater()
-        self.adjustSize()
+        if adjust_size:
+            self.adjustSize()
 
     def _render_preview_items(self) -> None:
         self._clear_tracker_widgets()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Callable, Sequence
 from typing import Any
 
@@ -137,9 +138,12 @@ class TrackerRuntimeController(QtCore.QObject):
             if not isinstance(row, tuple) or len(row) != 2:
                 continue
             skill_id, duration = row
+            duration_seconds = float(duration)
+            if not math.isfinite(duration_seconds):
+                continue
             self._countdown_service.refresh(
                 skill_id=int(skill_id),
-                duration_seconds=max(0.0, float(duration)),
+                duration_seconds=max(0.0, duration_seconds),
             )
 
 
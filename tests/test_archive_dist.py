@@ -0,0 +1,124 @@
+import importlib.util
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath, PureWindowsPath
+
+import pytest
+
+_SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "archive_dist.py"
+
+
+@pytest.fixture()
+def archive_dist():
+    spec = importlib.util.spec_from_file_location("archive_dist", _SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize(
+    ("case_insensitive", "path_type"),
+    [(False, PurePosixPath), (True, PureWindowsPath)],
+)
+def test_bundle_files_sort_like_platform_paths(
+    archive_dist, monkeypatch, tmp_path, case_insensitive, path_type
+):
+    bundle_dir = tmp_path / "d2rso"
+    relative_paths = ["Zeta.dll", "alpha.dll", "_internal/Qt/b.pyd", "_internal/a"]
+    for relative_path in relative_paths:
+        path = bundle_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+    monkeypatch.setattr(archive_dist, "DIST_DIR", bundle_dir)
+    monkeypatch.setattr(archive_dist, "_CASE_INSENSITIVE_PATHS", case_insensitive)
+
+    ordered = [relative_path for relative_path, _ in archive_dist._iter_bundle_files()]
+
+    assert ordered == [
+        path.as_posix() for path in sorted(path_type(p) for p in relative_paths)
+    ]
+
+
+def _write_bundle(bundle_dir: Path) -> dict[str, bytes]:
+    contents = {
+        "d2rso.exe": bytes(range(256)) * 64,
+        "_internal/base_library.txt": b"import d2rso\n" * 4096,
+        "_internal/empty.dat": b"",
+        "assets/skills/orb.png": b"\x89PNG" + bytes(range(200)),
+    }
+    for relative_path, data in contents.items():
+        path = bundle_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return contents
+
+
+def _write_stdlib_zip(archive_dist, output_path: Path, bundle_dir: Path) -> None:
+    timestamp = archive_dist._normalized_zip_timestamp()
+    with zipfile.ZipFile(output_path, "w") as archive:
+        for relative_path, path in archive_dist._iter_bundle_files():
+            info = zipfile.ZipInfo(f"{bundle_dir.name}/{relative_path}", timestamp)
+            info.compress_type = (
+                zipfile.ZIP_STORED
+                if archive_dist._is_stored(relative_path)
+                else zipfile.ZIP_DEFLATED
+            )
+            info.create_system = 3
+            info.external_attr = 0o100644 << 16
+            archive.writestr(
+                info,
+                Path(path).read_bytes(),
+                compresslevel=archive_dist.DEFAULT_ZIP_LEVEL,
+            )
+
+
+@pytest.mark.parametrize("raw_append", [True, False])
+def test_deterministic_zip_matches_stdlib_written_archive(
+    archive_dist, monkeypatch, tmp_path, raw_append
+):
+    bundle_dir = tmp_path / "d2rso"
+    contents = _write_bundle(bundle_dir)
+    monkeypatch.setattr(archive_dist, "DIST_DIR", bundle_dir)
+    monkeypatch.setattr(archive_dist, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    if not raw_append:
+        monkeypatch.setattr(
+            archive_dist,
+            "_ZIPFILE_RAW_APPEND_ATTRIBUTES",
+            (*archive_dist._ZIPFILE_RAW_APPEND_ATTRIBUTES, "_not_a_zipfile_attribute"),
+        )
+    output_path = tmp_path / "release.zip"
+    expected_path = tmp_path / "expected.zip"
+
+    archive_dist._write_deterministic_zip(
+        output_path,
+        archive_dist._iter_bundle_files(),
+        archive_dist.ZIP_BACKEND_ZLIB,
+        archive_dist.DEFAULT_ZIP_LEVEL,
+    )
+    _write_stdlib_zip(archive_dist, expected_path, bundle_dir)
+
+    with (
+        zipfile.ZipFile(output_path) as archive,
+        zipfile.ZipFile(expected_path) as expected,
+    ):
+        assert archive.testzip() is None
+        assert len(archive.infolist()) == len(contents)
+        for info, expected_info in zip(
+            archive.infolist(), expected.infolist(), strict=True
+        ):
+            for attribute in (
+                "filename",
+                "date_time",
+                "compress_type",
+                "create_system",
+                "external_attr",
+                "flag_bits",
+                "CRC",
+                "file_size",
+                "compress_size",
+                "header_offset",
+            ):
+                assert getattr(info, attribute) == getattr(expected_info, attribute)
+            assert archive.read(info) == expected.read(expected_info)
+    assert output_path.read_bytes() == expected_path.read_bytes()
@@ -111,6 +111,22 @@ def test_negative_duration_refresh_rejects_invalid_input():
         service.refresh(skill_id=5, duration_seconds=-1.0, now=20.0)
 
 
+def test_non_finite_duration_refresh_rejects_invalid_input():
+    clock = FakeClock(start=0.0)
+    service = CountdownService(time_provider=clock)
+    service.refresh(skill_id=1, duration_seconds=1.0)
+
+    for duration in (float("nan"), float("inf")):
+        with pytest.raises(ValueError, match="duration_seconds must be finite"):
+            service.refresh(skill_id=5, duration_seconds=duration)
+
+    clock.advance(1.5)
+    events = service.emit_updates()
+
+    assert [(event.skill_id, event.completed) for event in events] == [(1, True)]
+    assert service.active_count == 0
+
+
 def test_emit_updates_mixes_completion_and_active_update_in_same_tick():
     clock = FakeClock(start=0.0)
     service = CountdownService(time_provider=clock)
@@ -127,3 +143,59 @@ def test_emit_updates_mixes_completion_and_active_update_in_same_tick():
     assert events_by_id[2].type is CountdownEventType.UPDATED
     assert events_by_id[2].remaining_seconds == 1.5
     assert [countdown.skill_id for countdown in service.list_active()] == [2]
+
+
+def test_refresh_past_original_expiry_keeps_timer_active():
+    clock = FakeClock(start=0.0)
+    service = CountdownService(time_provider=clock)
+    service.refresh(skill_id=4, duration_seconds=1.0)
+
+    clock.advance(0.5)
+    service.refresh(skill_id=4, duration_seconds=2.0)
+
+    clock.advance(1.0)
+    events = service.emit_updates()
+    assert len(events) == 1
+    assert events[0].type is CountdownEventType.UPDATED
+    assert events[0].remaining_seconds == 1.0
+
+    clock.advance(1.0)
+    events = service.emit_updates()
+    assert len(events) == 1
+    assert events[0].type is CountdownEventType.REMOVED
+    assert events[0].completed is True
+    assert service.active_count == 0
+
+
+def test_batch_subscribers_receive_one_call_per_tick():
+    service = CountdownService()
+    batches: list[list[tuple[CountdownEventType, int]]] = []
+    service.subscribe_batch(
+        lambda events: batches.append(
+            [(event.type, event.skill_id) for event in events]
+        )
+    )
+
+    service.refresh(skill_id=1, duration_seconds=1.0, now=0.0)
+    service.refresh(skill_id=2, duration_seconds=3.0, now=0.0)
+    service.emit_updates(now=2.0)
+
+    assert batches == [
+        [(CountdownEventType.UPDATED, 1)],
+        [(CountdownEventType.UPDATED, 2)],
+        [(CountdownEventType.REMOVED, 1), (CountdownEventType.UPDATED, 2)],
+    ]
+
+
+def test_list_active_orders_by_skill_id_across_inserts_and_removals():
+    service = CountdownService()
+    for skill_id in (9, 3, 5):
+        service.refresh(skill_id=skill_id, duration_seconds=10.0, now=0.0)
+
+    assert [item.skill_id for item in service.list_active(now=1.0)] == [3, 5, 9]
+
+    service.remove(skill_id=5, now=1.0)
+    service.refresh(skill_id=3, duration_seconds=0.0, now=1.0)
+    service.refresh(skill_id=1, duration_seconds=2.0, now=1.0)
+
+    assert [item.skill_id for item in service.list_active(now=2.0)] == [1, 9]
@@ -1,5 +1,6 @@
 import importlib
 import platform
+import subprocess
 import sys
 from pathlib import Path
 from types import SimpleNamespace
@@ -36,6 +37,54 @@ def test_run_is_callable():
     assert callable(run)
 
 
+def test_package_import_defers_heavy_submodules():
+    probe = (
+        "import sys, d2rso; "
+        "print(sorted(name for name in ('PySide6', 'pygame', 'pynput') "
+        "if name in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == "[]"
+
+
+def test_main_module_import_defers_qt():
+    probe = (
+        "import sys, d2rso.main; "
+        "print(sorted(name for name in ('PySide6', 'd2rso.main_window') "
+        "if name in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == "[]"
+
+
+def test_input_router_import_defers_input_backends():
+    probe = (
+        "import sys, d2rso.input_router, d2rso.tracker_runtime; "
+        "print(sorted(name for name in ('pygame', 'pynput') "
+        "if name in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert completed.stdout.strip() == "[]"
+
+
 def test_dunder_main_import_is_safe():
     module = importlib.import_module("d2rso.__main__")
 
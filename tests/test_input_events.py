@@ -1,16 +1,22 @@
+import time
+from enum import Enum
+
 import pytest
 
+import d2rso.input_events as input_events_module
 from d2rso.input_events import (
     InputEvent,
     InputSource,
     gamepad_event,
     infer_input_source_from_code,
     keyboard_event,
+    make_input_event,
     mouse_event,
     normalize_gamepad_code,
     normalize_input_code,
     normalize_keyboard_code,
     normalize_mouse_code,
+    try_make_input_event,
 )
 
 
@@ -72,3 +78,53 @@ def test_source_inference_and_generic_normalization_follow_tracker_naming():
 def test_invalid_device_code_is_rejected_for_event_creation():
     with pytest.raises(ValueError):
         mouse_event("scroll-wheel")
+
+
+def test_canonical_fast_path_codes_normalize_to_themselves():
+    for code in input_events_module._CANONICAL_KEYBOARD_CODES:
+        assert input_events_module._normalize_keyboard_raw(code) == code
+    for code in input_events_module._CANONICAL_MOUSE_CODES:
+        assert input_events_module._normalize_mouse_raw(code) == code
+    for code in input_events_module._CANONICAL_GAMEPAD_CODES:
+        assert input_events_module._normalize_gamepad_raw(code) == code
+
+
+def test_make_input_event_matches_direct_construction():
+    built = make_input_event("shift_l", source="kbd", timestamp=5, pressed=0)
+    direct = InputEvent(code="shift_l", source="kbd", timestamp=5, pressed=0)
+
+    assert built == direct
+    assert type(built.timestamp) is float
+    assert built.pressed is False
+    with pytest.raises(ValueError, match="Could not normalize"):
+        make_input_event("not-a-key", source=InputSource.KEYBOARD)
+
+
+def test_event_helpers_stamp_events_from_the_monotonic_clock():
+    before = time.monotonic()
+    event = keyboard_event("a")
+
+    assert before <= event.timestamp <= time.monotonic()
+
+
+def test_try_make_input_event_returns_none_for_unsupported_codes():
+    assert try_make_input_event("not-a-key", source=InputSource.KEYBOARD) is None
+    assert try_make_input_event("mouse9", source="mouse") is None
+
+    event = try_make_input_event("button.left", source="mouse", timestamp=7.0)
+    assert event == mouse_event("button.left", timestamp=7.0)
+    with pytest.raises(ValueError, match="Unsupported input source"):
+        try_make_input_event("f1", source="touchpad")
+
+
+def test_enum_key_members_normalize_like_pynput_special_keys():
+    class _FakeKey(Enum):
+        shift_l = 1
+        f5 = 2
+        esc = 3
+
+    assert normalize_keyboard_code(_FakeKey.shift_l) == "LShiftKey"
+    assert normalize_keyboard_code(_FakeKey.f5) == "F5"
+    assert keyboard_event(_FakeKey.esc).code == "Escape"
+    # Repeated lookups for the same member hit the extraction cache.
+    assert normalize_keyboard_code(_FakeKey.shift_l) == "LShiftKey"
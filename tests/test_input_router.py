@@ -6,8 +6,15 @@ from types import SimpleNamespace
 
 import pytest
 
+from d2rso import input_events as input_events_module
 from d2rso import input_router as input_router_module
-from d2rso.input_events import InputSource, gamepad_event, keyboard_event, mouse_event
+from d2rso.input_events import (
+    InputSource,
+    gamepad_event,
+    keyboard_event,
+    mouse_event,
+    try_make_input_event,
+)
 from d2rso.input_router import (
     GamepadDeviceInfo,
     GamepadInputAdapter,
@@ -112,12 +119,14 @@ class _FakePygameEvent:
     button: int | None = None
     axis: int | None = None
     value: float | None = None
+    instance_id: int | None = None
 
 
 class _FakeEventQueue:
     def __init__(self) -> None:
         self._events: list[_FakePygameEvent] = []
         self._lock = threading.Lock()
+        self.filter_calls: list[tuple[str, list[int] | None]] = []
 
     def push(self, event: _FakePygameEvent) -> None:
         with self._lock:
@@ -129,6 +138,12 @@ class _FakeEventQueue:
             self._events.clear()
         return items
 
+    def set_blocked(self, event_types) -> None:
+        self.filter_calls.append(("blocked", event_types))
+
+    def set_allowed(self, event_types) -> None:
+        self.filter_calls.append(("allowed", event_types))
+
 
 class _FakeJoystick:
     def __init__(
@@ -389,6 +404,207 @@ def test_keyboard_adapter_rolls_back_if_listener_start_fails() -> None:
     assert holder["listener"].join_count == 1
 
 
+def test_keyboard_adapter_coalesces_autorepeat_presses_until_release(
+    monkeypatch,
+) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(input_events_module.time, "monotonic", lambda: clock[0])
+    holder: dict[str, _FakeListener] = {}
+
+    def _factory(on_press, on_release):
+        listener = _FakeListener(on_press=on_press, on_release=on_release)
+        holder["listener"] = listener
+        return listener
+
+    received = []
+    adapter = KeyboardInputAdapter(listener_factory=_factory)
+    adapter.set_event_callback(received.append)
+    adapter.start()
+
+    listener = holder["listener"]
+    # OS autorepeat: a ~500 ms initial delay, then a press every ~33 ms, with
+    # another key pressed and released in between.
+    listener.on_press("f8")
+    clock[0] += 0.5
+    listener.on_press("f8")
+    clock[0] += 0.033
+    listener.on_press("f9")
+    clock[0] += 0.033
+    listener.on_press("f8")
+    listener.on_release("f9")
+    clock[0] += 0.033
+    listener.on_press("f8")
+    listener.on_release("f8")
+    clock[0] += 0.033
+    listener.on_press("f8")
+    adapter.stop()
+
+    assert [(event.code, event.pressed) for event in received] == [
+        ("F8", True),
+        ("F9", True),
+        ("F9", False),
+        ("F8", False),
+        ("F8", True),
+    ]
+    assert received[0].timestamp == 100.0
+    assert received[-1].timestamp == pytest.approx(100.632)
+
+
+@dataclass(frozen=True)
+class _FakeKeyCode:
+    char: str | None
+    vk: int | None = None
+
+
+def test_keyboard_adapter_releases_keys_whose_character_changed_while_held() -> None:
+    received = []
+    adapter = KeyboardInputAdapter(listener_factory=_FakeListener)
+    adapter.set_event_callback(received.append)
+
+    # Shift pressed mid-hold: "1" releases as "!", "-" as "_", "a" as a ctrl
+    # character; none of those normalize, but the virtual key still matches.
+    for char, shifted, vk in (("1", "!", 0x31), ("-", "_", 0xBD), ("a", "\x01", 0x41)):
+        adapter._on_press(_FakeKeyCode(char, vk))
+        adapter._on_release(_FakeKeyCode(shifted, vk))
+        adapter._on_press(_FakeKeyCode(char, vk))
+        adapter._on_release(_FakeKeyCode(char, vk))
+
+    assert [(event.code, event.pressed) for event in received] == [
+        ("D1", True),
+        ("D1", True),
+        ("D1", False),
+        ("Subtract", True),
+        ("Subtract", True),
+        ("Subtract", False),
+        ("A", True),
+        ("A", True),
+        ("A", False),
+    ]
+
+
+def test_keyboard_adapter_matches_case_changed_release_without_virtual_key() -> None:
+    received = []
+    adapter = KeyboardInputAdapter(listener_factory=_FakeListener)
+    adapter.set_event_callback(received.append)
+
+    adapter._on_press(_FakeKeyCode("a"))
+    adapter._on_release(_FakeKeyCode("A"))
+    adapter._on_press(_FakeKeyCode("a"))
+
+    assert [(event.code, event.pressed) for event in received] == [
+        ("A", True),
+        ("A", False),
+        ("A", True),
+    ]
+
+
+def test_keyboard_adapter_forgets_held_keys_across_restart() -> None:
+    holder: dict[str, _FakeListener] = {}
+
+    def _factory(on_press, on_release):
+        listener = _FakeListener(on_press=on_press, on_release=on_release)
+        holder["listener"] = listener
+        return listener
+
+    received = []
+    adapter = KeyboardInputAdapter(listener_factory=_factory)
+    adapter.set_event_callback(received.append)
+    adapter.start()
+    holder["listener"].on_press("f8")
+    adapter.stop()
+    adapter.start()
+    holder["listener"].on_press("f8")
+    adapter.stop()
+
+    assert [(event.code, event.pressed) for event in received] == [
+        ("F8", True),
+        ("F8", True),
+    ]
+
+
+def test_input_router_limits_keyboard_hook_to_configured_keys() -> None:
+    keyboard_adapter = KeyboardInputAdapter(listener_factory=_FakeListener)
+    router = InputRouter(adapters=[keyboard_adapter, _FakeAdapter()])
+
+    def _key(vk_code: int) -> SimpleNamespace:
+        return SimpleNamespace(vkCode=vk_code)
+
+    assert keyboard_adapter._win32_event_filter(None, _key(0x41)) is True
+    router.set_skill_items(
+        [
+            SkillItem(id=1, select_key="LShiftKey", skill_key="F1"),
+            SkillItem(id=2, select_key=None, skill_key="MOUSE2"),
+        ]
+    )
+
+    assert keyboard_adapter._win32_event_filter(None, _key(0x70)) is True
+    assert keyboard_adapter._win32_event_filter(None, _key(0xA0)) is True
+    assert keyboard_adapter._win32_event_filter(None, _key(0x41)) is False
+
+    keyboard_adapter.set_key_filter(None)
+    assert keyboard_adapter._win32_event_filter(None, _key(0x41)) is True
+
+
+def test_input_router_keyboard_hook_passes_every_key_for_a_code() -> None:
+    keyboard_adapter = KeyboardInputAdapter(listener_factory=_FakeListener)
+    router = InputRouter(adapters=[keyboard_adapter, _FakeAdapter()])
+
+    def _key(vk_code: int) -> SimpleNamespace:
+        return SimpleNamespace(vkCode=vk_code)
+
+    # Numpad 1 types "1", which normalizes to D1 just like the main-row key.
+    router.set_skill_items([SkillItem(id=1, select_key=None, skill_key="D1")])
+    assert keyboard_adapter._win32_event_filter(None, _key(0x31)) is True
+    assert keyboard_adapter._win32_event_filter(None, _key(0x61)) is True
+    assert keyboard_adapter._win32_event_filter(None, _key(0x41)) is False
+
+    # The main-row +/- keys (VK_OEM_PLUS/VK_OEM_MINUS) and other layout-dependent
+    # keys normalize by character, so their codes disable the filter.
+    for code in ("Add", "Subtract", "OemSemicolon"):
+        router.set_skill_items([SkillItem(id=1, select_key=None, skill_key=code)])
+        for vk_code in (0x6B, 0x6D, 0xBB, 0xBD, 0xBA):
+            assert keyboard_adapter._win32_event_filter(None, _key(vk_code)) is True
+
+
+def test_keyboard_adapter_reads_the_clock_once_per_press(monkeypatch) -> None:
+    clock_reads = []
+
+    def _fake_monotonic() -> float:
+        clock_reads.append(None)
+        return 100.0 + len(clock_reads)
+
+    monkeypatch.setattr(input_events_module.time, "monotonic", _fake_monotonic)
+    received = []
+    adapter = KeyboardInputAdapter(listener_factory=_FakeListener)
+    adapter.set_event_callback(received.append)
+
+    adapter._on_press("f8")
+
+    assert len(clock_reads) == 1
+    assert [event.timestamp for event in received] == [101.0]
+
+
+def test_keyboard_adapter_coalesces_presses_from_a_wrapped_factory() -> None:
+    received = []
+
+    def _wrapped_factory(raw_code, *, pressed):
+        return try_make_input_event(raw_code, source="keyboard", pressed=pressed)
+
+    adapter = KeyboardInputAdapter(
+        listener_factory=_FakeListener, event_factory=_wrapped_factory
+    )
+    adapter.set_event_callback(received.append)
+
+    adapter._on_press("f8")
+    adapter._on_press("f8")
+    adapter._on_release("f8")
+
+    assert [(event.code, event.pressed) for event in received] == [
+        ("F8", True),
+        ("F8", False),
+    ]
+
+
 def test_keyboard_adapter_start_stop_are_idempotent_and_join_listener() -> None:
     holder: dict[str, _FakeListener] = {}
 
@@ -589,6 +805,32 @@ def test_gamepad_adapter_maps_trigger_axis_motion_to_virtual_button_events() ->
     assert [event.pressed for event in received] == [True, False]
 
 
+def test_gamepad_adapter_tracks_trigger_state_per_joystick() -> None:
+    fake_pygame = _FakePygame(joystick_count=2)
+    received = []
+    adapter = GamepadInputAdapter(
+        pygame_module=fake_pygame,
+        poll_interval_seconds=0.001,
+    )
+    adapter.set_event_callback(received.append)
+
+    adapter.start()
+    for instance_id, value in ((0, 0.9), (1, 0.9), (0, 0.1), (1, 0.1)):
+        fake_pygame.event.push(
+            _FakePygameEvent(
+                type=fake_pygame.JOYAXISMOTION,
+                axis=5,
+                value=value,
+                instance_id=instance_id,
+            )
+        )
+
+    assert _wait_until(lambda: len(received) == 4)
+    adapter.stop()
+
+    assert [event.pressed for event in received] == [True, True, False, False]
+
+
 def test_gamepad_adapter_routes_trigger_axis_motion_to_tracker_engine() -> None:
     fake_pygame = _FakePygame(joystick_count=1)
     adapter = GamepadInputAdapter(
@@ -650,6 +892,128 @@ def test_gamepad_adapter_routes_controller_input_to_tracker_engine() -> None:
     assert fake_pygame.quit_count == 1
 
 
+def test_gamepad_adapter_keeps_polling_without_sleeping_while_events_arrive() -> None:
+    fake_pygame = _FakePygame(joystick_count=1)
+    pending = [
+        _FakePygameEvent(type=fake_pygame.JOYBUTTONDOWN, button=button)
+        for button in (1, 2, 3)
+    ]
+    # Hand out one event per poll, as a capped backend would.
+    fake_pygame.event.get = lambda: [pending.pop(0)] if pending else []
+    received = []
+    adapter = GamepadInputAdapter(
+        pygame_module=fake_pygame,
+        poll_interval_seconds=5.0,
+    )
+    adapter.set_event_callback(received.append)
+
+    adapter.start()
+    assert _wait_until(lambda: len(received) == 3)
+    adapter.stop()
+
+    assert [event.code for event in received] == ["Buttons1", "Buttons2", "Buttons3"]
+
+
+def test_gamepad_adapter_backs_off_to_idle_interval_between_empty_polls() -> None:
+    fake_pygame = _FakePygame(joystick_count=1)
+    waits: list[float] = []
+    adapter = GamepadInputAdapter(
+        pygame_module=fake_pygame,
+        poll_interval_seconds=0.002,
+        idle_poll_interval_seconds=0.01,
+    )
+
+    def _record_wait(timeout: float) -> bool:
+        waits.append(timeout)
+        return len(waits) >= 5
+
+    adapter._wait_for_stop = _record_wait
+    adapter._run_loop()
+
+    assert waits == pytest.approx([0.002, 0.004, 0.008, 0.01, 0.01])
+
+
+def test_gamepad_adapter_opens_and_closes_joysticks_across_hotplug() -> None:
+    fake_pygame = _FakePygame(joystick_count=2)
+    adapter = GamepadInputAdapter(
+        pygame_module=fake_pygame,
+        poll_interval_seconds=0.001,
+    )
+
+    adapter.start()
+    first = fake_pygame.joystick.instances[1]
+    fake_pygame.joystick._count = 1
+    fake_pygame.event.push(_FakePygameEvent(type=fake_pygame.JOYDEVICEREMOVED))
+    assert _wait_until(lambda: first.quit_count == 1)
+    adapter.stop()
+
+    joystick = fake_pygame.joystick.instances[0]
+    assert (joystick.init_count, joystick.quit_count) == (1, 1)
+    assert (first.init_count, first.quit_count) == (1, 1)
+
+
+class _FakeWaitingEventQueue(_FakeEventQueue):
+    def __init__(self) -> None:
+        super().__init__()
+        self.wait_timeouts: list[int] = []
+
+    def wait(self, timeout: int) -> _FakePygameEvent:
+        self.wait_timeouts.append(timeout)
+        with self._lock:
+            if self._events:
+                return self._events.pop(0)
+        time.sleep(0.001)
+        return _FakePygameEvent(type=0)
+
+
+def test_gamepad_adapter_blocks_in_event_wait_when_idle() -> None:
+    fake_pygame = _FakePygame(joystick_count=1)
+    fake_pygame.event = _FakeWaitingEventQueue()
+    received = []
+    adapter = GamepadInputAdapter(pygame_module=fake_pygame)
+    adapter.set_event_callback(received.append)
+
+    adapter.start()
+    assert _wait_until(lambda: fake_pygame.event.wait_timeouts)
+    fake_pygame.event.push(_FakePygameEvent(type=fake_pygame.JOYBUTTONDOWN, button=3))
+    assert _wait_until(lambda: received)
+    adapter.stop()
+
+    assert [event.code for event in received] == ["Buttons3"]
+    assert set(fake_pygame.event.wait_timeouts) == {50}
+
+
+def test_gamepad_adapter_stop_posts_wake_event_for_blocked_wait() -> None:
+    fake_pygame = _FakePygame(joystick_count=1)
+    fake_pygame.USEREVENT = 24
+    fake_pygame.event = _FakeWaitingEventQueue()
+    posted = []
+    fake_pygame.event.Event = lambda event_type: _FakePygameEvent(type=event_type)
+    fake_pygame.event.post = posted.append
+    adapter = GamepadInputAdapter(pygame_module=fake_pygame)
+
+    adapter.start()
+    assert _wait_until(lambda: fake_pygame.event.wait_timeouts)
+    adapter.stop()
+
+    assert [event.type for event in posted] == [24]
+    assert ("allowed", [10, 11, 12, 13, 14, 24]) in fake_pygame.event.filter_calls
+
+
+def test_gamepad_adapter_filters_event_queue_to_joystick_events() -> None:
+    fake_pygame = _FakePygame(joystick_count=1)
+    adapter = GamepadInputAdapter(pygame_module=fake_pygame)
+
+    adapter.start()
+    adapter.stop()
+
+    assert fake_pygame.event.filter_calls == [
+        ("blocked", None),
+        ("allowed", [10, 11, 12, 13, 14]),
+        ("allowed", None),
+    ]
+
+
 def test_gamepad_adapter_emits_double_digit_button_indices() -> None:
     fake_pygame = _FakePygame(joystick_count=1)
     received = []
@@ -687,6 +1051,26 @@ def test_gamepad_adapter_cleans_up_when_thread_start_fails() -> None:
     assert fake_pygame.quit_count == 1
 
 
+def test_gamepad_adapter_refuses_to_start_while_previous_loop_holds_lock(
+    monkeypatch,
+) -> None:
+    monkeypatch.setattr(input_router_module, "_LISTENER_JOIN_TIMEOUT_SECONDS", 0.01)
+    fake_pygame = _FakePygame(joystick_count=0)
+    adapter = GamepadInputAdapter(pygame_module=fake_pygame)
+    adapter._stop_lock.acquire()
+
+    with pytest.raises(RuntimeError, match="still stopping"):
+        adapter.start()
+
+    assert adapter.is_running is False
+    assert fake_pygame.init_count == 0
+
+    adapter._stop_lock.release()
+    adapter.start()
+    assert adapter.is_running is True
+    adapter.stop()
+
+
 def test_input_router_routes_all_device_events_to_tracker_engine() -> None:
     keyboard = _FakeAdapter()
     mouse = _FakeAdapter()
@@ -729,6 +1113,29 @@ def test_input_router_routes_all_device_events_to_tracker_engine() -> None:
     assert gamepad.stop_count == 1
 
 
+def test_input_router_direct_dispatch_routes_on_the_calling_thread() -> None:
+    adapter = _FakeAdapter()
+    engine = TrackerInputEngine(
+        skill_items=[SkillItem(id=5, select_key=None, skill_key="F5")]
+    )
+    routed: list[tuple[str, list[int], str]] = []
+    router = InputRouter(
+        tracker_engine=engine,
+        adapters=[adapter],
+        on_triggered=lambda event, items: routed.append(
+            (event.code, [item.id for item in items], threading.current_thread().name)
+        ),
+        direct_dispatch=True,
+    )
+
+    router.start()
+    adapter.emit(keyboard_event("f5"))
+    router.stop()
+    adapter.emit(keyboard_event("f5"))
+
+    assert routed == [("F5", [5], threading.current_thread().name)]
+
+
 def test_input_router_uses_release_events_to_end_gamepad_combo_hold() -> None:
     gamepad = _FakeAdapter()
     engine = TrackerInputEngine(
@@ -761,6 +1168,23 @@ def test_input_router_uses_release_events_to_end_gamepad_combo_hold() -> None:
     router.stop()
 
 
+def test_input_router_drops_oldest_events_when_buffer_is_full() -> None:
+    router = InputRouter(adapters=[], event_buffer_capacity=2)
+    router._accepting_events = True
+
+    for code in ("f1", "f2", "f3"):
+        router.route_input_event(keyboard_event(code))
+
+    assert [event.code for event in router._event_buffer] == ["F2", "F3"]
+
+
+def test_input_router_rejects_non_event_payloads() -> None:
+    router = InputRouter(adapters=[])
+
+    with pytest.raises(TypeError, match="must be an InputEvent"):
+        router.route_input_event("F1")
+
+
 def test_input_router_start_stop_are_idempotent() -> None:
     adapter = _FakeAdapter()
     router = InputRouter(adapters=[adapter])
@@ -802,3 +1226,30 @@ def test_input_router_reports_stop_failure_after_shutdown() -> None:
     assert adapter.start_count == 1
     assert adapter.stop_count == 1
     assert router.is_running is False
+
+
+def test_raise_thread_priority_requests_interactive_qos_on_macos(monkeypatch) -> None:
+    import ctypes
+
+    calls = []
+
+    class _FakeLibSystem:
+        def pthread_set_qos_class_self_np(self, qos_class, priority):
+            calls.append((qos_class, priority))
+            return 0
+
+    monkeypatch.setattr(input_router_module.platform, "system", lambda: "Darwin")
+    monkeypatch.setattr(ctypes, "CDLL", lambda _name: _FakeLibSystem())
+
+    input_router_module._raise_current_thread_priority()
+
+    assert calls == [(0x21, 0)]
+
+
+def test_raise_thread_priority_is_a_no_op_on_linux(monkeypatch) -> None:
+    import ctypes
+
+    monkeypatch.setattr(input_router_module.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(ctypes, "CDLL", lambda _name: pytest.fail("loaded libc"))
+
+    input_router_module._raise_current_thread_priority()
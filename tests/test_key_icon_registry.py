@@ -1,5 +1,7 @@
+import os
 from pathlib import Path
 
+import d2rso.key_icon_registry as key_icon_registry_module
 from d2rso.key_icon_registry import KeyEntry, KeyIconRegistry
 
 _PNG_1X1 = bytes.fromhex(
@@ -57,3 +59,133 @@ def test_missing_icon_paths_fail_gracefully(tmp_path):
     assert catalog.get_icon("missing.png") is None
     assert catalog.get_icon_path("missing.png") is None
     assert catalog.get_icon_bytes("missing.png") is None
+
+
+def test_icon_lookups_are_cached_until_reload(tmp_path):
+    assets_dir = tmp_path / "assets" / "skills"
+    assets_dir.mkdir(parents=True)
+    catalog = KeyIconRegistry(assets_dir=assets_dir)
+
+    assert catalog.get_icon("orb.png") is None
+    (assets_dir / "orb.png").write_bytes(_PNG_1X1)
+    assert catalog.get_icon("orb.png") is None
+
+    catalog.reload_icons()
+    icon = catalog.get_icon("orb.png")
+    assert icon is not None
+    assert catalog.get_icon("orb.png") is icon
+    assert catalog.get_icon(Path("orb.png")) is icon
+
+
+def test_direct_path_misses_are_not_cached(tmp_path):
+    catalog = KeyIconRegistry(assets_dir=tmp_path / "assets" / "skills")
+    icon_path = tmp_path / "custom" / "orb.png"
+
+    assert catalog.get_icon(str(icon_path)) is None
+    icon_path.parent.mkdir()
+    icon_path.write_bytes(_PNG_1X1)
+
+    icon = catalog.get_icon(str(icon_path))
+    assert icon is not None
+    assert icon.path == icon_path.resolve()
+
+
+def test_icon_lookup_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(key_icon_registry_module, "_GET_ICON_CACHE_SIZE", 2)
+    catalog = KeyIconRegistry(assets_dir=tmp_path)
+
+    for name in ("a.png", "b.png", "c.png"):
+        catalog.get_icon(name)
+
+    assert list(catalog._get_icon_cache) == ["b.png", "c.png"]
+
+
+def test_key_catalog_is_shared_between_registries(tmp_path):
+    first = KeyIconRegistry(assets_dir=tmp_path)
+    second = KeyIconRegistry(assets_dir=tmp_path)
+
+    assert first.available_keys is second.available_keys
+    assert first.get_key("d1") is second.get_key("D1")
+
+
+def test_icon_bytes_are_read_on_first_use(tmp_path, monkeypatch):
+    assets_dir = tmp_path / "assets" / "skills"
+    assets_dir.mkdir(parents=True)
+    (assets_dir / "orb.png").write_bytes(_PNG_1X1)
+    reads: list[Path] = []
+    original_read_bytes = Path.read_bytes
+
+    def _tracking_read_bytes(self):
+        reads.append(self)
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", _tracking_read_bytes)
+    catalog = KeyIconRegistry(assets_dir=assets_dir)
+    icon = catalog.get_icon("orb.png")
+
+    assert icon is not None
+    assert icon.size == len(_PNG_1X1)
+    assert reads == []
+    assert catalog.get_icon_bytes("orb.png") == _PNG_1X1
+    assert icon.data == _PNG_1X1
+    assert reads == [icon.path]
+
+
+def test_icon_bytes_retry_failed_reads_and_follow_replaced_files(tmp_path, monkeypatch):
+    assets_dir = tmp_path / "assets" / "skills"
+    assets_dir.mkdir(parents=True)
+    orb = assets_dir / "orb.png"
+    orb.write_bytes(_PNG_1X1)
+    monkeypatch.setattr(
+        key_icon_registry_module, "_can_read_image_file", lambda _path: True
+    )
+    catalog = KeyIconRegistry(assets_dir=assets_dir)
+    original_read_bytes = Path.read_bytes
+    failures = [OSError("transient")]
+
+    def _flaky_read_bytes(self):
+        if failures:
+            raise failures.pop()
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", _flaky_read_bytes)
+    assert catalog.get_icon_bytes("orb.png") is None
+    assert catalog.get_icon_bytes("orb.png") == _PNG_1X1
+
+    # Same size, new contents: only the modification time tells them apart.
+    replacement = bytes(reversed(_PNG_1X1))
+    orb.write_bytes(replacement)
+    file_stat = orb.stat()
+    os.utime(orb, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000))
+    catalog.reload_icons()
+    assert catalog.get_icon_bytes("orb.png") == replacement
+
+
+def test_reload_only_sniffs_new_or_changed_icon_files(tmp_path, monkeypatch):
+    assets_dir = tmp_path / "assets" / "skills"
+    assets_dir.mkdir(parents=True)
+    (assets_dir / "orb.png").write_bytes(_PNG_1X1)
+    sniffed: list[str] = []
+
+    def _fake_can_read(path):
+        sniffed.append(path.name)
+        return True
+
+    monkeypatch.setattr(
+        key_icon_registry_module, "_can_read_image_file", _fake_can_read
+    )
+    catalog = KeyIconRegistry(assets_dir=assets_dir)
+    catalog.reload_icons()
+    (assets_dir / "shield.png").write_bytes(_PNG_1X1)
+    catalog.reload_icons()
+
+    assert sniffed == ["orb.png", "shield.png"]
+
+
+def test_get_key_matches_exact_and_loosely_written_codes(tmp_path):
+    catalog = KeyIconRegistry(assets_dir=tmp_path)
+
+    assert catalog.get_key("Buttons7") is catalog.get_key(" buttons7 ")
+    assert catalog.get_key("OemComma") == KeyEntry(name="Comma", code="OemComma")
+    assert catalog.get_key("  ") is catalog.get_key(None)
+    assert catalog.get_key("NotAKey") is None
@@ -360,6 +360,7 @@ def test_add_and_remove_skill_rows_persist_and_refresh_immediately():
     _flush_events()
 
     assert window.skill_table.rowCount() == 1
+    assert window.skill_table.rowHeight(0) == 46
     saved = store.saved_settings
     assert len(saved.skill_items) == 1
     added = saved.skill_items[0]
@@ -429,6 +430,36 @@ def test_skill_row_validation_normalizes_aliases_and_rejects_invalid_keys():
     window.close()
 
 
+def test_skill_icon_combos_share_one_icon_per_asset(tmp_path):
+    _get_qapp()
+    assets_dir = tmp_path / "skills"
+    assets_dir.mkdir()
+    image = QtGui.QImage(4, 4, QtGui.QImage.Format.Format_ARGB32)
+    image.fill(QtGui.QColor(40, 120, 200))
+    assert image.save(str(assets_dir / "orb.png"))
+
+    settings = Settings(
+        last_selected_profile_id=0,
+        profiles=[Profile(id=0, name="Default")],
+        skill_items=[
+            SkillItem(id=1, profile_id=0, icon_file_name="orb.png", skill_key="F1"),
+            SkillItem(id=2, profile_id=0, icon_file_name="orb.png", skill_key="F2"),
+        ],
+    )
+    window = MainWindow(
+        settings_store=_MemorySettingsStore(settings),
+        icon_registry=KeyIconRegistry(assets_dir=assets_dir),
+        input_router_factory=_FakeInputRouter,
+    )
+
+    first_combo = window.skill_table.cellWidget(0, 1)
+    second_combo = window.skill_table.cellWidget(1, 1)
+    assert first_combo.itemData(1) == "orb.png"
+    assert first_combo.itemIcon(1).cacheKey() == second_combo.itemIcon(1).cacheKey()
+
+    window.close()
+
+
 def test_skill_row_accepts_trigger_gamepad_skill_without_select_key():
     settings = Settings(
         last_selected_profile_id=0,
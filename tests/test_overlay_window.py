@@ -213,6 +213,70 @@ def test_overlay_binds_countdown_updates_and_removes_completed_timers(tmp_path):
     overlay.close()
 
 
+def test_overlay_poll_timer_sleeps_while_no_countdowns_are_active():
+    _get_qapp()
+    clock = FakeClock()
+    service = CountdownService(time_provider=clock)
+    overlay = CooldownOverlayWindow(
+        settings=Settings(),
+        icon_registry=KeyIconRegistry(assets_dir="does-not-exist"),
+        poll_interval_ms=1000,
+    )
+    overlay.bind_countdown_service(service)
+
+    overlay._poll_countdowns()
+    assert overlay._poll_timer.isActive() is False
+
+    service.refresh(skill_id=3, duration_seconds=2.0)
+    _flush_qt_events()
+    assert overlay._poll_timer.isActive() is True
+
+    clock.advance(2.0)
+    overlay._poll_countdowns()
+    _flush_qt_events()
+    assert overlay.snapshot_active_trackers() == []
+    assert overlay._poll_timer.isActive() is False
+
+    overlay.unbind_countdown_service()
+    overlay.close()
+
+
+def test_overlay_cards_reuse_the_scaled_icon_pixmap(tmp_path):
+    _get_qapp()
+    assets_dir = tmp_path / "assets" / "skills"
+    assets_dir.mkdir(parents=True)
+    image = QtGui.QImage(4, 4, QtGui.QImage.Format.Format_ARGB32)
+    image.fill(QtGui.QColor(200, 40, 40))
+    assert image.save(str(assets_dir / "orb.png"))
+
+    service = CountdownService(time_provider=FakeClock())
+    overlay = CooldownOverlayWindow(
+        settings=Settings(),
+        icon_registry=KeyIconRegistry(assets_dir=assets_dir),
+        poll_interval_ms=1000,
+    )
+    overlay.set_skill_items(
+        [
+            SkillItem(id=1, icon_file_name="orb.png", skill_key="F1"),
+            SkillItem(id=2, icon_file_name="orb.png", skill_key="F2"),
+        ]
+    )
+    overlay.bind_countdown_service(service)
+    service.refresh(skill_id=1, duration_seconds=5.0)
+    service.refresh(skill_id=2, duration_seconds=5.0)
+    _flush_qt_events()
+
+    first, second = (
+        overlay._widgets_by_skill_id[skill_id]._icon_label.pixmap()
+        for skill_id in (1, 2)
+    )
+    assert not first.isNull()
+    assert first.cacheKey() == second.cacheKey()
+
+    overlay.unbind_countdown_service()
+    overlay.close()
+
+
 def test_overlay_respects_left_insert_order_and_hidden_digits_setting(tmp_path):
     _get_qapp()
     assets_dir = tmp_path / "assets" / "skills"
@@ -1,3 +1,5 @@
+import pytest
+
 import d2rso.key_icon_registry as key_icon_registry_module
 import d2rso.main as main_module
 from d2rso.key_icon_registry import KeyIconRegistry
@@ -91,3 +93,40 @@ def test_run_auto_exit_uses_window_shutdown_path(monkeypatch):
     assert scheduled[0][0] == 1200
     scheduled[0][1]()
     assert window.exit_count == 1
+
+
+def test_run_refuses_to_start_without_a_display(monkeypatch):
+    class _FakeApp:
+        @staticmethod
+        def instance():
+            return None
+
+        def __init__(self, _argv) -> None:
+            raise AssertionError("QApplication should not be created")
+
+    monkeypatch.setattr(main_module.sys, "platform", "linux")
+    for name in main_module._DISPLAY_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr(main_module.QtWidgets, "QApplication", _FakeApp)
+    monkeypatch.setattr(
+        main_module,
+        "build_window",
+        lambda: pytest.fail("window should not be built"),
+    )
+
+    with pytest.raises(RuntimeError, match="No display available"):
+        main_module.run()
+
+
+def test_can_display_accepts_any_display_or_qt_platform(monkeypatch):
+    monkeypatch.setattr(main_module.sys, "platform", "linux")
+    for name in main_module._DISPLAY_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    assert main_module._can_display() is False
+
+    monkeypatch.setenv("WAYLAND_DISPLAY", "wayland-0")
+    assert main_module._can_display() is True
+
+    monkeypatch.delenv("WAYLAND_DISPLAY")
+    monkeypatch.setattr(main_module.sys, "platform", "win32")
+    assert main_module._can_display() is True